@@ -4,32 +4,76 @@ WiseRate is a modern CLI application for monitoring currency exchange rates
 with support for alerts, caching, and an interactive mode.
 
 Example:
-    >>> from wiserate import Settings, WiseRateApp
-    >>> settings = Settings()
+    >>> from wiserate import WiseRateApp, get_settings
+    >>> settings = get_settings()
     >>> app = WiseRateApp(settings)
 """
 
 __version__ = "2.5.2"
 __author__ = "Amet13"
 
-from .config import Settings
-from .exceptions import (
-    AlertError,
-    APIError,
-    CacheError,
-    ConfigurationError,
-    NetworkError,
-    RateLimitError,
-    ValidationError,
-    WiseRateError,
-)
-from .models import Alert, CurrencyPair, ExchangeRate
-from .utils import format_currency_amount, get_currency_name, validate_currency_code
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Settings, get_settings, reload_settings
+    from .exceptions import (
+        AlertError,
+        APIError,
+        CacheError,
+        ConfigurationError,
+        NetworkError,
+        RateLimitError,
+        ValidationError,
+        WiseRateError,
+    )
+    from .models import Alert, CurrencyPair, ExchangeRate
+    from .utils import format_currency_amount, get_currency_name, validate_currency_code
+
+# Public names and the submodule defining each one. They are imported on first
+# access (PEP 562) so that `import wiserate` doesn't pull in pydantic/structlog.
+_LAZY_IMPORTS = {
+    "Settings": ".config",
+    "get_settings": ".config",
+    "reload_settings": ".config",
+    "WiseRateError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "APIError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "CacheError": ".exceptions",
+    "AlertError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "NetworkError": ".exceptions",
+    "CurrencyPair": ".models",
+    "ExchangeRate": ".models",
+    "Alert": ".models",
+    "validate_currency_code": ".utils",
+    "get_currency_name": ".utils",
+    "format_currency_amount": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily from their submodules."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "__version__",
     "__author__",
     "Settings",
+    "get_settings",
+    "reload_settings",
     "CurrencyPair",
     "ExchangeRate",
     "Alert",
@@ -0,0 +1,123 @@
+"""Persistent event loop thread for running coroutines from synchronous code."""
+
+import atexit
+import threading
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
+
+# asyncio is imported on first use so CLI commands that never run a coroutine
+# don't pay for loading it
+if TYPE_CHECKING:
+    import asyncio
+
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+# How long to wait for a cancelled coroutine to run its cleanup on Ctrl+C
+_CANCEL_TIMEOUT = 5.0
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when it's installed."""
+    try:
+        import uvloop
+    except ImportError:  # optional speedup, see the "fast" extra
+        import asyncio
+
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared loop, starting its thread on first use."""
+    global _loop, _thread
+    with _lock:
+        if _loop is None:
+            loop = _new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="wiserate-loop", daemon=True)
+            thread.start()
+            _loop, _thread = loop, thread
+            atexit.register(_shutdown)
+        return _loop
+
+
+def _shutdown() -> None:
+    """Stop the shared loop at interpreter exit."""
+    if _loop is not None and _thread is not None:
+        _loop.call_soon_threadsafe(_loop.stop)
+        _thread.join(timeout=_CANCEL_TIMEOUT)
+
+
+async def _tracked[T](coro: Coroutine[Any, Any, T], done: threading.Event) -> T:
+    """Await a coroutine and signal once it has fully finished, cleanup included."""
+    try:
+        return await coro
+    finally:
+        done.set()
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared loop thread and wait for its result.
+
+    Unlike asyncio.run(), the loop is created once per process and reused by
+    every call, so back-to-back commands skip loop setup and teardown.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        KeyboardInterrupt: If interrupted; the coroutine is cancelled and given
+            time to clean up before this is raised
+    """
+    import asyncio
+
+    done = threading.Event()
+    future = asyncio.run_coroutine_threadsafe(_tracked(coro, done), _get_loop())
+    try:
+        return future.result()
+    except KeyboardInterrupt:
+        future.cancel()
+        done.wait(timeout=_CANCEL_TIMEOUT)
+        raise
+
+
+async def _start[T](coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+    """Wrap a coroutine in a task on the running loop."""
+    import asyncio
+
+    return asyncio.create_task(coro)
+
+
+async def _cancel(task: asyncio.Task[Any]) -> None:
+    """Cancel a task and wait until it has finished, cleanup included."""
+    import asyncio
+
+    task.cancel()
+    await asyncio.wait([task])
+
+
+def spawn[T](coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+    """Start a coroutine on the shared loop thread without waiting for it.
+
+    Args:
+        coro: Coroutine to run in the background
+
+    Returns:
+        The task running the coroutine; stop it with cancel()
+    """
+    return run_sync(_start(coro))
+
+
+def cancel(task: asyncio.Task[Any]) -> None:
+    """Cancel a task started with spawn() and wait for it to finish.
+
+    Resources the task uses can be released safely once this returns.
+
+    Args:
+        task: Task returned by spawn()
+    """
+    run_sync(_cancel(task))
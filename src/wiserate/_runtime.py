@@ -0,0 +1,48 @@
+"""Shared application instance for the current async context."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .app import WiseRateApp
+    from .config import Settings
+
+_APP: ContextVar[WiseRateApp | None] = ContextVar("_APP", default=None)
+
+
+def current_app() -> WiseRateApp | None:
+    """Return the app started by the enclosing app_context(), if any."""
+    return _APP.get()
+
+
+@asynccontextmanager
+async def app_context(settings: Settings) -> AsyncIterator[WiseRateApp]:
+    """Provide a started WiseRateApp, reusing the one already active in this context.
+
+    The outermost app_context() owns the app: it starts it on entry and stops it
+    on exit. Nested uses (e.g. commands dispatched from the interactive REPL or
+    batch mode) get the same warm instance and HTTP connection pool.
+
+    Args:
+        settings: Settings used if a new app has to be created
+
+    Yields:
+        The active application instance
+    """
+    app = _APP.get()
+    if app is not None:
+        yield app
+        return
+
+    from .app import WiseRateApp
+
+    app = WiseRateApp(settings)
+    await app.start()
+    token = _APP.set(app)
+    try:
+        yield app
+    finally:
+        _APP.reset(token)
+        await app.stop()
@@ -1,18 +1,32 @@
 """Alert service for managing exchange rate alerts."""
 
 import asyncio
+import atexit
+import weakref
+from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 import structlog
 from pydantic import ValidationError
 
 from .config import Settings
 from .models import Alert, CurrencyPair, ExchangeRate
-from .utils import load_json_file_async, save_json_file_async
+from .utils import load_json_file, save_json_file, save_json_file_async
 
 logger = structlog.get_logger(__name__)
 
+# Live services, flushed by one exit hook without keeping them alive
+_services: weakref.WeakSet[AlertService] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_at_exit() -> None:
+    """Persist unflushed changes of every live alert service at interpreter exit."""
+    for service in list(_services):
+        service._flush_sync()
+
 
 class AlertService:
     """Service for managing exchange rate alerts."""
@@ -20,17 +34,45 @@ class AlertService:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self._alerts: dict[str, Alert] = {}
+        # Serialized form of each alert, kept in sync with _alerts so saves
+        # don't have to re-serialize every alert on each mutation. Built once
+        # per alert; later changes only patch the affected fields.
+        self._serialized: dict[str, dict[str, Any]] = {}
+        # Changes not yet written; see flush(). A count rather than a flag so
+        # changes made while a write is in flight stay pending after it.
+        self._unsaved_changes = 0
         self._load_alerts()
+        _services.add(self)
+
+    def _mark_dirty(self) -> None:
+        """Record a pending change, writing immediately only outside an event loop.
 
-    def _run_async_save(self) -> None:
-        """Run async save operation, handling both sync and async contexts."""
+        In async contexts writes are coalesced: callers await flush() once at the
+        end of a batch of mutations (e.g. once per monitoring iteration).
+        """
+        self._unsaved_changes += 1
         try:
-            loop = asyncio.get_running_loop()
-            # We're in an async context, schedule the task
-            loop.create_task(self._save_alerts_async())
+            asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop running, use asyncio.run
-            asyncio.run(self._save_alerts_async())
+            # No event loop running, nothing will flush for us later
+            self._flush_sync()
+
+    async def flush(self) -> None:
+        """Write pending alert changes to persistent storage, if any."""
+        written = self._unsaved_changes
+        if written and await self._save_alerts_async():
+            self._unsaved_changes -= written
+
+    def _flush_sync(self) -> None:
+        """Write pending alert changes with the synchronous writer, if any.
+
+        Used outside an event loop, where starting one just to write would
+        cost more than the write, and at interpreter exit, when executor
+        threads are no longer available.
+        """
+        written = self._unsaved_changes
+        if written and self._save_alerts():
+            self._unsaved_changes -= written
 
     def add_alert(
         self, currency_pair: CurrencyPair, threshold: Decimal, is_above: bool = True
@@ -40,6 +82,7 @@ class AlertService:
 
         alert_key = self._get_alert_key(currency_pair)
         self._alerts[alert_key] = alert
+        self._serialized[alert_key] = self._serialize_alert(alert)
 
         logger.info(
             "Alert added",
@@ -47,7 +90,7 @@ class AlertService:
             threshold=str(threshold),
             is_above=is_above,
         )
-        self._run_async_save()
+        self._mark_dirty()
 
         return alert
 
@@ -57,8 +100,9 @@ class AlertService:
 
         if alert_key in self._alerts:
             del self._alerts[alert_key]
+            self._serialized.pop(alert_key, None)
             logger.info("Alert removed", pair=str(currency_pair))
-            self._run_async_save()
+            self._mark_dirty()
             return True
 
         return False
@@ -75,46 +119,79 @@ class AlertService:
     def check_alerts(self, exchange_rate: ExchangeRate) -> list[Alert]:
         """Check if any alerts should be triggered for the given exchange rate."""
         triggered_alerts = []
-        currency_pair = CurrencyPair(source=exchange_rate.source, target=exchange_rate.target)
-        alert_key = self._get_alert_key(currency_pair)
+        # Rates carry validated codes already; use their key without a CurrencyPair
+        alert_key = exchange_rate.cache_key
 
         if alert_key in self._alerts:
             alert = self._alerts[alert_key]
             if alert.should_trigger(exchange_rate.rate):
-                alert.trigger()
+                self._trigger_alert(alert_key, alert, exchange_rate)
                 triggered_alerts.append(alert)
-                logger.info(
-                    "Alert triggered",
-                    pair=str(currency_pair),
-                    threshold=str(alert.threshold),
-                    rate=str(exchange_rate.rate),
-                )
-
-        # Note: Save is handled by caller in async context
+
+        # Note: Save is handled by caller via flush()
+        return triggered_alerts
+
+    def check_alerts_batch(self, exchange_rates: Iterable[ExchangeRate]) -> list[Alert]:
+        """Check alerts against many exchange rates in a single pass.
+
+        Does one dict lookup per rate without building CurrencyPair models.
+        Triggered alerts are only marked dirty; callers flush() once afterwards.
+        """
+        triggered_alerts = []
+        alerts = self._alerts
+
+        for exchange_rate in exchange_rates:
+            alert_key = exchange_rate.cache_key
+            alert = alerts.get(alert_key)
+            if alert is not None and alert.should_trigger(exchange_rate.rate):
+                self._trigger_alert(alert_key, alert, exchange_rate)
+                triggered_alerts.append(alert)
+
         return triggered_alerts
 
+    def _trigger_alert(self, alert_key: str, alert: Alert, exchange_rate: ExchangeRate) -> None:
+        """Mark an alert as triggered and record the change for the next flush."""
+        alert.trigger()
+        # Only last_triggered changed; the rest of the stored form is reused as-is
+        self._serialized[alert_key]["last_triggered"] = (
+            alert.last_triggered.isoformat() if alert.last_triggered else None
+        )
+        self._unsaved_changes += 1
+        logger.info(
+            "Alert triggered",
+            pair=f"{exchange_rate.source}/{exchange_rate.target}",
+            threshold=str(alert.threshold),
+            rate=str(exchange_rate.rate),
+        )
+
     def _get_alert_key(self, currency_pair: CurrencyPair) -> str:
         """Get the key for storing an alert."""
-        return f"{currency_pair.source}_{currency_pair.target}"
+        return currency_pair.cache_key
+
+    @staticmethod
+    def _serialize_alert(alert: Alert) -> dict[str, Any]:
+        """Convert an alert to its JSON-serializable storage form."""
+        return {
+            "currency_pair": {
+                "source": alert.currency_pair.source,
+                "target": alert.currency_pair.target,
+            },
+            "threshold": str(alert.threshold),
+            "is_above": alert.is_above,
+            "enabled": alert.enabled,
+            "created_at": alert.created_at.isoformat(),
+            "last_triggered": (alert.last_triggered.isoformat() if alert.last_triggered else None),
+        }
 
     def _load_alerts(self) -> None:
-        """Load alerts from persistent storage (sync wrapper for async implementation)."""
-        try:
-            # Use async implementation if in async context, otherwise run sync
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, schedule the task
-                loop.create_task(self._load_alerts_async())
-            except RuntimeError:
-                # No event loop running, use asyncio.run
-                asyncio.run(self._load_alerts_async())
-        except Exception as e:
-            logger.error("Failed to load alerts", error=str(e))
+        """Load alerts from persistent storage.
 
-    async def _load_alerts_async(self) -> None:
-        """Load alerts from persistent storage asynchronously."""
+        The alerts file is small, so it is read synchronously in one shot. This
+        also means alerts are available as soon as the service is constructed,
+        even inside a running event loop.
+        """
         try:
-            data = await load_json_file_async(self.settings.alerts_file, default={})
+            data = load_json_file(self.settings.alerts_file, default={})
 
             for alert_data in data.values():
                 try:
@@ -165,6 +242,7 @@ class AlertService:
 
                     alert_key = self._get_alert_key(currency_pair)
                     self._alerts[alert_key] = alert
+                    self._serialized[alert_key] = self._serialize_alert(alert)
 
                 except (ValidationError, KeyError, ValueError) as e:
                     logger.warning("Invalid alert data", data=alert_data, error=str(e))
@@ -172,34 +250,37 @@ class AlertService:
         except Exception as e:
             logger.error("Failed to load alerts", error=str(e))
 
-    async def _save_alerts_async(self) -> None:
-        """Save alerts to persistent storage asynchronously."""
+    def _save_alerts(self) -> bool:
+        """Save alerts to persistent storage.
+
+        Returns:
+            True if the alerts were written, False if the write failed
+        """
         try:
-            data = {}
-            for alert_key, alert in self._alerts.items():
-                data[alert_key] = {
-                    "currency_pair": {
-                        "source": alert.currency_pair.source,
-                        "target": alert.currency_pair.target,
-                    },
-                    "threshold": str(alert.threshold),
-                    "is_above": alert.is_above,
-                    "enabled": alert.enabled,
-                    "created_at": alert.created_at.isoformat(),
-                    "last_triggered": (
-                        alert.last_triggered.isoformat() if alert.last_triggered else None
-                    ),
-                }
-
-            await save_json_file_async(self.settings.alerts_file, data)
+            save_json_file(self.settings.alerts_file, self._serialized)
+        except Exception as e:
+            logger.error("Failed to save alerts", error=str(e))
+            return False
+        return True
+
+    async def _save_alerts_async(self) -> bool:
+        """Save alerts to persistent storage asynchronously.
 
+        Returns:
+            True if the alerts were written, False if the write failed
+        """
+        try:
+            await save_json_file_async(self.settings.alerts_file, self._serialized)
         except Exception as e:
             logger.error("Failed to save alerts", error=str(e))
+            return False
+        return True
 
     def clear_all_alerts(self) -> None:
         """Clear all alerts."""
         self._alerts.clear()
-        self._run_async_save()
+        self._serialized.clear()
+        self._mark_dirty()
         logger.info("All alerts cleared")
 
     def enable_alert(self, currency_pair: CurrencyPair) -> bool:
@@ -207,7 +288,8 @@ class AlertService:
         alert = self.get_alert(currency_pair)
         if alert:
             alert.enabled = True
-            self._run_async_save()
+            self._serialized[self._get_alert_key(currency_pair)]["enabled"] = True
+            self._mark_dirty()
             logger.info("Alert enabled", pair=str(currency_pair))
             return True
         return False
@@ -217,7 +299,8 @@ class AlertService:
         alert = self.get_alert(currency_pair)
         if alert:
             alert.enabled = False
-            self._run_async_save()
+            self._serialized[self._get_alert_key(currency_pair)]["enabled"] = False
+            self._mark_dirty()
             logger.info("Alert disabled", pair=str(currency_pair))
             return True
         return False
@@ -7,8 +7,9 @@ import structlog
 
 from .alerts import AlertService
 from .config import Settings
+from .constants import MAX_CONCURRENT_REQUESTS
 from .exchange import ExchangeRateService
-from .models import CurrencyPair, ExchangeRate
+from .models import Alert, CurrencyPair, ExchangeRate
 
 logger = structlog.get_logger(__name__)
 
@@ -37,9 +38,9 @@ class WiseRateApp:
             # Check if any alerts should be triggered
             triggered_alerts = self.alert_service.check_alerts(rate)
 
-            # Save alerts if any were triggered (async save since we're in async context)
+            # Persist last_triggered timestamps if any alerts fired
             if triggered_alerts:
-                await self.alert_service._save_alerts_async()
+                await self.alert_service.flush()
 
             # Log triggered alerts
             for triggered_alert in triggered_alerts:
@@ -70,10 +71,13 @@ class WiseRateApp:
         try:
             currency_pair = CurrencyPair(source=source, target=target)
             self.alert_service.add_alert(currency_pair, threshold, is_above)
-            # Await async save since we're in async context
-            await self.alert_service._save_alerts_async()
+            await self.alert_service.flush()
             logger.info(
-                f"Alert set: 1 {source} {'above' if is_above else 'below'} {threshold} {target}"
+                "Alert set",
+                source=source,
+                target=target,
+                threshold=str(threshold),
+                direction="above" if is_above else "below",
             )
             return True
 
@@ -94,9 +98,8 @@ class WiseRateApp:
             success = self.alert_service.remove_alert(currency_pair)
 
             if success:
-                # Await async save since we're in async context
-                await self.alert_service._save_alerts_async()
-                logger.info(f"Alert removed for {source}/{target}")
+                await self.alert_service.flush()
+                logger.info("Alert removed", source=source, target=target)
 
             return success
 
@@ -104,6 +107,10 @@ class WiseRateApp:
             logger.error("Failed to remove alert", source=source, target=target, error=str(e))
             return False
 
+    def get_alerts(self) -> list[Alert]:
+        """Get all alerts as structured objects."""
+        return self.alert_service.get_all_alerts()
+
     async def list_alerts(self) -> str:
         """List all active alerts."""
         alerts = self.alert_service.get_all_alerts()
@@ -128,61 +135,118 @@ class WiseRateApp:
             rates = await self.exchange_service.get_all_rates()
             logger.info("Updated all exchange rates", count=len(rates))
 
-            # Check all alerts
-            for rate in rates:
-                self.alert_service.check_alerts(rate)
+            # Check all alerts in one pass and write any changes once
+            triggered_alerts = self.alert_service.check_alerts_batch(rates)
+            if triggered_alerts:
+                await self.alert_service.flush()
 
         except Exception as e:
             logger.error("Failed to update all rates", error=str(e))
 
-    async def run_monitoring_loop(self, interval: int = 600) -> None:
-        """Run the monitoring loop to check alerts periodically."""
-        logger.info("Starting monitoring loop", interval_seconds=interval)
+    async def run_monitoring_loop(
+        self, interval: int = 600, batch_size: int = MAX_CONCURRENT_REQUESTS
+    ) -> None:
+        """Run the monitoring loop to check alerts periodically.
+
+        Args:
+            interval: Seconds to wait between checks
+            batch_size: Maximum number of per-pair rate requests in flight at once
+        """
+        logger.info("Starting monitoring loop", interval_seconds=interval, batch_size=batch_size)
+
+        # Sleep until a fixed schedule of deadlines rather than for `interval`
+        # after each check, so time spent checking doesn't accumulate as drift
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time()
 
         while True:
             try:
-                # Get all active alerts
-                alerts = self.alert_service.get_all_alerts()
-
-                if alerts:
-                    logger.info("Checking alerts", count=len(alerts))
-
-                    # Check all alerts concurrently using TaskGroup (Python 3.11+)
-                    enabled_alerts = [alert for alert in alerts if alert.enabled]
-                    if enabled_alerts:
-                        try:
-                            async with asyncio.TaskGroup() as tg:
-                                # Create tasks for all enabled alerts concurrently
-                                for alert in enabled_alerts:
-                                    tg.create_task(
-                                        self.get_exchange_rate(
-                                            alert.currency_pair.source,
-                                            alert.currency_pair.target,
-                                        )
-                                    )
-
-                            # Results are automatically awaited and exceptions handled by TaskGroup
-                            logger.debug(
-                                "Checked all alerts concurrently", count=len(enabled_alerts)
-                            )
-                        except* Exception as eg:
-                            # Handle ExceptionGroup from TaskGroup
-                            for exc in eg.exceptions:
-                                logger.error("Failed to check alert", error=str(exc))
-
-                # Wait for next interval
-                await asyncio.sleep(interval)
-
+                await self.check_alerts_once(batch_size)
             except asyncio.CancelledError:
                 logger.info("Monitoring loop cancelled")
                 break
             except Exception as e:
                 logger.error("Error in monitoring loop", error=str(e))
-                await asyncio.sleep(interval)
+
+            # If a check overran whole intervals, skip them instead of catching up
+            now = loop.time()
+            next_deadline = max(next_deadline + interval, now)
+
+            try:
+                await asyncio.sleep(next_deadline - now)
+            except asyncio.CancelledError:
+                logger.info("Monitoring loop cancelled")
+                break
+
+    async def check_alerts_once(self, batch_size: int = MAX_CONCURRENT_REQUESTS) -> None:
+        """Check every enabled alert once and persist any changes.
+
+        Args:
+            batch_size: Maximum number of per-pair rate requests in flight at once
+        """
+        alerts = self.alert_service.get_all_alerts()
+
+        if alerts:
+            logger.info("Checking alerts", count=len(alerts))
+
+            enabled_alerts = [alert for alert in alerts if alert.enabled]
+            if enabled_alerts:
+                enabled_alerts = await self._check_alerts_bulk(enabled_alerts)
+
+            # Fall back to per-pair fetches for anything the bulk request missed;
+            # one failing pair must not cancel the others, so collect exceptions
+            if enabled_alerts:
+                semaphore = asyncio.Semaphore(batch_size)
+                results = await asyncio.gather(
+                    *(self._check_alert(alert, semaphore) for alert in enabled_alerts),
+                    return_exceptions=True,
+                )
+
+                for alert, result in zip(enabled_alerts, results, strict=True):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            "Failed to check alert",
+                            pair=str(alert.currency_pair),
+                            error=str(result),
+                        )
+
+                logger.debug("Checked all alerts concurrently", count=len(enabled_alerts))
+
+        # Write all alert changes from this check at once
+        await self.alert_service.flush()
+
+    async def _check_alerts_bulk(self, alerts: list[Alert]) -> list[Alert]:
+        """Fetch rates for all alert pairs in bulk and check the alerts against them.
+
+        Returns:
+            Alerts whose rate could not be fetched in bulk.
+        """
+        pairs = {str(alert.currency_pair): alert.currency_pair for alert in alerts}
+        rates = await self.exchange_service.get_exchange_rates(pairs.values())
+
+        for triggered_alert in self.alert_service.check_alerts_batch(rates):
+            logger.info(
+                "Alert triggered",
+                source=triggered_alert.currency_pair.source,
+                target=triggered_alert.currency_pair.target,
+                threshold=str(triggered_alert.threshold),
+                is_above=triggered_alert.is_above,
+            )
+
+        fetched = {f"{rate.source}/{rate.target}" for rate in rates}
+        return [alert for alert in alerts if str(alert.currency_pair) not in fetched]
+
+    async def _check_alert(self, alert: Alert, semaphore: asyncio.Semaphore) -> ExchangeRate:
+        """Fetch the rate for an alert's pair, bounded by the shared semaphore."""
+        async with semaphore:
+            return await self.get_exchange_rate(
+                alert.currency_pair.source, alert.currency_pair.target
+            )
 
     async def stop(self) -> None:
         """Stop the application."""
         logger.info("Stopping WiseRate application")
+        await self.alert_service.flush()
         # Close HTTP client
         await self.exchange_service.close()
         logger.info("WiseRate application stopped")
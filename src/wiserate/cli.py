@@ -1,22 +1,70 @@
 """Command-line interface for the currency exchange bot."""
 
-import asyncio
 import sys
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
 from datetime import datetime
-from decimal import Decimal
-from functools import wraps
-from typing import Any
+from decimal import Decimal, InvalidOperation
+from functools import cache, lru_cache, wraps
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, TextIO, cast, override
 
 import click
-import structlog
-from rich.console import Console
-from rich.table import Table
 
-from .app import WiseRateApp
-from .config import Settings
+from . import __version__
+from ._loop import cancel, run_sync, spawn
+from ._runtime import app_context
+from .constants import MAX_CONCURRENT_REQUESTS
+
+# rich, structlog, asyncio, utils and the app (httpx, pydantic) are imported
+# where they are used, so `--help` and usage errors don't pay for loading them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.style import Style
+    from rich.table import Table
+
+    from .app import WiseRateApp
+    from .config import Settings
+
+
+# Level structlog was last configured with by setup_logging()
+_CONFIGURED_LEVEL: str | None = None
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+_CURRENCIES_PER_PAGE = 20
+_HELP_OPTIONS = (
+    "\n[yellow]Options:[/yellow]\n"
+    "  --update, -u    Update cache before getting rate\n"
+    "  --below         Alert when rate goes below threshold"
+)
+# Rows of the last table built by _config_table() and the table itself
+_config_table_cache: tuple[tuple[tuple[str, str], ...], Table] | None = None
+
+
+@cache
+def _console() -> Console:
+    """Return the shared rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
 
-console = Console()
+
+async def _run_with_app(
+    func: Callable[..., Coroutine[Any, Any, None]],
+    ctx: Any,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> None:
+    """Run a command coroutine with a started app, stopping it afterwards.
+
+    Exits via ctx.exit() rather than sys.exit(): SystemExit raised inside a task
+    would escape the shared loop thread instead of reaching the caller.
+    """
+    async with app_context(ctx.obj["settings"]) as app:
+        try:
+            await func(app, ctx, *args, **kwargs)
+        except click.exceptions.Exit:
+            raise
+        except Exception as e:
+            _console().print(f"[red]Error: {e}[/red]")
+            ctx.exit(1)
 
 
 def async_command(func: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., None]:
@@ -24,111 +72,303 @@ def async_command(func: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..
 
     @wraps(func)
     def wrapper(ctx: Any, *args: Any, **kwargs: Any) -> None:
-        async def run() -> None:
-            settings = ctx.obj["settings"]
-            app = WiseRateApp(settings)
-            await app.start()
+        run_sync(_run_with_app(func, ctx, args, kwargs))
 
-            try:
-                await func(app, ctx, *args, **kwargs)
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
-                sys.exit(1)
-            finally:
-                await app.stop()
+    return wrapper
 
-        asyncio.run(run())
 
-    return wrapper
+@lru_cache(maxsize=256)
+def _currency_info(currency: str) -> tuple[bool, str | None]:
+    """Return whether an upper-cased currency code is valid, and its name."""
+    from .utils import get_currency_name, validate_currency_code
+
+    return validate_currency_code(currency), get_currency_name(currency)
+
+
+@lru_cache(maxsize=1)
+def _sorted_currencies() -> tuple[tuple[str, str], ...]:
+    """Return (code, name) for every supported currency, sorted by code."""
+    from .utils import EXTENDED_CURRENCIES, get_currency_name
+
+    return tuple(
+        (currency, get_currency_name(currency) or "Unknown")
+        for currency in sorted(EXTENDED_CURRENCIES)
+    )
+
+
+@cache
+def _style(name: str) -> Style:
+    """Return a parsed rich style, so tables don't hand rich a string to re-parse."""
+    from rich.style import Style
+
+    return Style.parse(name)
+
+
+def _currency_page_count() -> int:
+    """Return how many interactive `currencies` pages there are."""
+    return -(-len(_sorted_currencies()) // _CURRENCIES_PER_PAGE)
+
+
+def _currency_page(page: int) -> tuple[tuple[str, str], ...]:
+    """Return the (code, name) rows shown on a 1-based `currencies` page."""
+    start = (page - 1) * _CURRENCIES_PER_PAGE
+    return _sorted_currencies()[start : start + _CURRENCIES_PER_PAGE]
+
+
+@cache
+def _currencies_table(page: int | None = None) -> Table:
+    """Build the currencies table once, for every currency or a single page."""
+    from rich.table import Table
+
+    if page is None:
+        title, rows = "Supported Currencies", _sorted_currencies()
+    else:
+        title = f"Supported Currencies (Page {page}/{_currency_page_count()})"
+        rows = _currency_page(page)
+
+    table = Table(title=title)
+    table.add_column("Code", style=_style("cyan"))
+    table.add_column("Name", style=_style("green"))
+
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+
+    return table
+
+
+def _config_table(settings: Settings) -> Table:
+    """Return the configuration table, rebuilt only when a displayed value changed.
+
+    Settings can be reassigned in place, so the table is keyed on the values
+    it shows rather than on the settings object.
+    """
+    global _config_table_cache
+    rows = (
+        ("API URL", settings.api_url),
+        ("Data Directory", str(settings.data_dir)),
+        ("Cache TTL", f"{settings.cache_ttl}s"),
+        ("Cache Stale TTL", f"{settings.cache_stale_ttl}s"),
+        ("Log Level", settings.log_level),
+        ("Max Requests/Min", str(settings.max_requests_per_minute)),
+    )
+    if _config_table_cache is not None and _config_table_cache[0] == rows:
+        return _config_table_cache[1]
+
+    from rich.table import Table
+
+    table = Table(title="WiseRate Configuration")
+    table.add_column("Setting", style=_style("cyan"))
+    table.add_column("Value", style=_style("green"))
+    for row in rows:
+        table.add_row(*row)
+
+    _config_table_cache = (rows, table)
+    return table
+
+
+@lru_cache(maxsize=1)
+def _help_table() -> Table:
+    """Build the interactive help table once."""
+    from rich.table import Table
+
+    help_table = Table(title="WiseRate Interactive Mode - Available Commands")
+    help_table.add_column("Command", style=_style("cyan"), no_wrap=True)
+    help_table.add_column("Description", style=_style("green"))
+    help_table.add_column("Example", style=_style("yellow"))
+
+    help_table.add_row("rate <src> <tgt> [--update]", "Get exchange rate", "rate EUR USD")
+    help_table.add_row(
+        "alert <src> <tgt> <thresh> [--below]", "Set price alert", "alert EUR USD 1.05"
+    )
+    help_table.add_row("remove-alert <src> <tgt>", "Remove alert", "remove-alert EUR USD")
+    help_table.add_row("alerts", "List all alerts", "alerts")
+    help_table.add_row("currencies [page]", "List currencies", "currencies 2")
+    help_table.add_row("validate <currency>", "Validate currency code", "validate EUR")
+    help_table.add_row("update", "Update all rates", "update")
+    help_table.add_row("config", "Show configuration", "config")
+    help_table.add_row("help", "Show this help", "help")
+    help_table.add_row("quit", "Exit interactive mode", "quit")
+
+    return help_table
+
+
+def _write_plain_currencies(rows: tuple[tuple[str, str], ...]) -> None:
+    """Write (code, name) rows to stdout as tab-separated lines in one write."""
+    sys.stdout.write("".join(f"{code}\t{name}\n" for code, name in rows))
+
+
+class _DecimalType(click.ParamType):
+    """Click parameter type parsing the raw argument straight into a Decimal."""
+
+    name = "decimal"
+
+    @override
+    def convert(self, value: Any, param: Any, ctx: Any) -> Decimal:
+        if isinstance(value, Decimal):
+            return value
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            self.fail(f"{value!r} is not a valid number", param, ctx)
+
+
+_DECIMAL = _DecimalType()
+
+
+class _CurrencyCodeType(click.ParamType):
+    """Click parameter type normalizing a currency code to upper case once."""
+
+    name = "currency"
+
+    @override
+    def convert(self, value: Any, param: Any, ctx: Any) -> str:
+        return str(value).upper()
+
+
+_CURRENCY = _CurrencyCodeType()
+
+
+class _Stderr:
+    """File-like object that writes to whatever sys.stderr is at call time.
+
+    Loggers are cached on first use, so holding on to sys.stderr itself would
+    keep writing to a stream that has since been swapped out (e.g. by tests).
+    """
+
+    def __init__(self, binary: bool = False) -> None:
+        self._binary = binary
+
+    def _stream(self) -> IO[Any]:
+        return sys.stderr.buffer if self._binary else sys.stderr
+
+    def write(self, data: Any) -> int:
+        return self._stream().write(data)
+
+    def flush(self) -> None:
+        self._stream().flush()
 
 
 def setup_logging(level: str) -> None:
-    """Setup structured logging."""
+    """Setup structured logging.
+
+    Calls with the level that is already configured (e.g. repeated in-process
+    invocations) are no-ops.
+    """
+    global _CONFIGURED_LEVEL
+    level = level.upper()
+    if level == _CONFIGURED_LEVEL:
+        return
+
+    import logging
+
+    import structlog
+
+    # Log straight to stderr instead of going through the stdlib logging
+    # machinery: human-readable on a terminal, one JSON object per line otherwise
+    logger_factory: Any
+    if sys.stderr.isatty():
+        renderer: Any = structlog.dev.ConsoleRenderer()
+        logger_factory = structlog.WriteLoggerFactory(file=cast("TextIO", _Stderr()))
+    else:
+        try:
+            import orjson
+        except ImportError:  # pragma: no cover - optional speedup, see the "fast" extra
+            renderer = structlog.processors.JSONRenderer()
+            logger_factory = structlog.WriteLoggerFactory(file=cast("TextIO", _Stderr()))
+        else:
+            renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+            logger_factory = structlog.BytesLoggerFactory(
+                file=cast("BinaryIO", _Stderr(binary=True))
+            )
+
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.dev.ConsoleRenderer(),
+            renderer,
         ],
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=logger_factory,
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, level, logging.INFO)),
         cache_logger_on_first_use=True,
     )
+    _CONFIGURED_LEVEL = level
 
 
 @click.group()
-@click.version_option(version="2.5.2", prog_name="WiseRate")
-@click.option("--log-level", default="INFO", help="Log level")
+@click.version_option(version=__version__, prog_name="WiseRate")
+@click.option("--log-level", default="WARNING", show_default=True, help="Log level")
 @click.pass_context
 def cli(ctx: Any, log_level: str) -> None:
     """WiseRate - Modern CLI tool for monitoring currency exchange rates."""
     setup_logging(log_level)
     ctx.ensure_object(dict)
 
+    from .config import get_settings
+
     try:
-        settings = Settings()
+        settings = get_settings()
         ctx.obj["settings"] = settings
     except Exception as e:
-        console.print(f"[red]Configuration error: {e}[/red]")
+        _console().print(f"[red]Configuration error: {e}[/red]")
         sys.exit(1)
 
 
 @cli.command()
-@click.argument("source", type=str)
-@click.argument("target", type=str)
+@click.argument("source", type=_CURRENCY)
+@click.argument("target", type=_CURRENCY)
 @click.option("--update", "-u", is_flag=True, help="Update currency rates cache")
 @click.pass_context
 @async_command
 async def rate(app: WiseRateApp, ctx: Any, source: str, target: str, update: bool) -> None:
     """Get exchange rate for a currency pair."""
-    rate = await app.get_exchange_rate(source.upper(), target.upper(), update)
+    console = _console()
+
+    rate = await app.get_exchange_rate(source, target, update)
     console.print(f"[green]1 {rate.source} = {rate.rate} {rate.target}[/green]")
 
 
 @cli.command()
-@click.argument("source", type=str)
-@click.argument("target", type=str)
-@click.argument("threshold", type=float)
+@click.argument("source", type=_CURRENCY)
+@click.argument("target", type=_CURRENCY)
+@click.argument("threshold", type=_DECIMAL)
 @click.option("--below", is_flag=True, help="Alert when rate goes below threshold")
 @click.pass_context
 @async_command
 async def alert(
-    app: WiseRateApp, ctx: Any, source: str, target: str, threshold: float, below: bool
+    app: WiseRateApp, ctx: Any, source: str, target: str, threshold: Decimal, below: bool
 ) -> None:
     """Set an exchange rate alert."""
+    console = _console()
+
     is_above = not below
-    success = await app.set_alert(source.upper(), target.upper(), Decimal(str(threshold)), is_above)
+    success = await app.set_alert(source, target, threshold, is_above)
 
     if success:
         direction = "below" if below else "above"
-        console.print(
-            f"[green]Alert set: 1 {source.upper()} {direction} {threshold} {target.upper()}[/green]"
-        )
+        console.print(f"[green]Alert set: 1 {source} {direction} {threshold} {target}[/green]")
     else:
         console.print("[red]Failed to set alert[/red]")
-        sys.exit(1)
+        ctx.exit(1)
 
 
 @cli.command()
-@click.argument("source", type=str)
-@click.argument("target", type=str)
+@click.argument("source", type=_CURRENCY)
+@click.argument("target", type=_CURRENCY)
 @click.pass_context
 @async_command
 async def remove_alert(app: WiseRateApp, ctx: Any, source: str, target: str) -> None:
     """Remove an exchange rate alert."""
-    success = await app.remove_alert(source.upper(), target.upper())
+    console = _console()
+
+    success = await app.remove_alert(source, target)
 
     if success:
-        console.print(f"[green]Alert removed for {source.upper()}/{target.upper()}[/green]")
+        console.print(f"[green]Alert removed for {source}/{target}[/green]")
     else:
-        console.print(f"[yellow]No alert found for {source.upper()}/{target.upper()}[/yellow]")
+        console.print(f"[yellow]No alert found for {source}/{target}[/yellow]")
 
 
 @cli.command()
@@ -136,6 +376,8 @@ async def remove_alert(app: WiseRateApp, ctx: Any, source: str, target: str) ->
 @async_command
 async def alerts(app: WiseRateApp, ctx: Any) -> None:
     """List all active alerts."""
+    console = _console()
+
     alerts_text = await app.list_alerts()
     console.print(alerts_text)
 
@@ -145,21 +387,35 @@ async def alerts(app: WiseRateApp, ctx: Any) -> None:
 @async_command
 async def update(app: WiseRateApp, ctx: Any) -> None:
     """Update all currency rates."""
+    console = _console()
+
     await app.update_all_rates()
     console.print("[green]All currency rates updated[/green]")
 
 
 @cli.command()
 @click.option("--interval", default=600, help="Monitoring interval in seconds")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=MAX_CONCURRENT_REQUESTS,
+    show_default=True,
+    help="Maximum concurrent rate requests per check",
+)
 @click.pass_context
 @async_command
-async def monitor(app: WiseRateApp, ctx: Any, interval: int) -> None:
+async def monitor(app: WiseRateApp, ctx: Any, interval: int, batch_size: int) -> None:
     """Run the monitoring loop to check alerts."""
-    console.print(f"[green]Starting monitoring loop (interval: {interval}s)[/green]")
-    console.print("[yellow]Press Ctrl+C to stop[/yellow]")
+    console = _console()
+
+    console.print(
+        f"[green]Starting monitoring loop (interval: {interval}s)[/green]",
+        "[yellow]Press Ctrl+C to stop[/yellow]",
+        sep="\n",
+    )
 
     try:
-        await app.run_monitoring_loop(interval)
+        await app.run_monitoring_loop(interval, batch_size)
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitoring stopped by user[/yellow]")
 
@@ -168,47 +424,36 @@ async def monitor(app: WiseRateApp, ctx: Any, interval: int) -> None:
 @click.pass_context
 def test(ctx: Any) -> None:
     """Test the application configuration and connections."""
+    console = _console()
+
     settings = ctx.obj["settings"]
 
     async def run() -> None:
-        app = WiseRateApp(settings)
-
         try:
-            await app.start()
-            console.print("[green]✓ Application started successfully[/green]")
-            console.print("[green]✓ Configuration loaded successfully[/green]")
+            async with app_context(settings):
+                console.print(
+                    "[green]✓ Application started successfully[/green]",
+                    "[green]✓ Configuration loaded successfully[/green]",
+                    sep="\n",
+                )
 
         except Exception as e:
             console.print(f"[red]✗ Test failed: {e}[/red]")
-            sys.exit(1)
-        finally:
-            await app.stop()
+            ctx.exit(1)
 
-    asyncio.run(run())
+    run_sync(run())
 
 
 @cli.command()
 @click.pass_context
 def config(ctx: Any) -> None:
     """Show current configuration."""
-    settings = ctx.obj["settings"]
-
-    table = Table(title="WiseRate Configuration")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="green")
-
-    table.add_row("API URL", settings.api_url)
-    table.add_row("Data Directory", str(settings.data_dir))
-    table.add_row("Cache TTL", f"{settings.cache_ttl}s")
-    table.add_row("Log Level", settings.log_level)
-    table.add_row("Max Requests/Min", str(settings.max_requests_per_minute))
-
-    console.print(table)
+    _console().print(_config_table(ctx.obj["settings"]))
 
 
 @cli.command()
-@click.argument("source", type=str)
-@click.argument("target", type=str)
+@click.argument("source", type=_CURRENCY)
+@click.argument("target", type=_CURRENCY)
 @click.option(
     "--format",
     "-f",
@@ -224,10 +469,24 @@ async def history(
 ) -> None:
     """Get historical exchange rate data."""
     # For now, just get current rate (historical data would need API support)
-    rate = await app.get_exchange_rate(source.upper(), target.upper(), update)
+    rate = await app.get_exchange_rate(source, target, update)
+
+    if format == "table":
+        from rich.table import Table
+
+        table = Table(title=f"Exchange Rate: {rate.source} → {rate.target}")
+        table.add_column("Field", style=_style("cyan"))
+        table.add_column("Value", style=_style("green"))
+        table.add_row("Rate", str(rate.rate))
+        table.add_row("Timestamp", rate.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"))
+        table.add_row("Source", f"{rate.source} ({rate.source_name or 'Unknown'})")
+        table.add_row("Target", f"{rate.target} ({rate.target_name or 'Unknown'})")
+        _console().print(table)
+        return
 
+    # Machine-readable formats go straight to stdout, bypassing rich
     if format == "json":
-        import json
+        from .utils import json_dumps
 
         data = {
             "source": rate.source,
@@ -237,18 +496,14 @@ async def history(
             "source_name": rate.source_name,
             "target_name": rate.target_name,
         }
-        console.print(json.dumps(data, indent=2))
-    elif format == "csv":
-        console.print(f"{rate.source},{rate.target},{rate.rate},{rate.timestamp.isoformat()}")
-    else:  # table
-        table = Table(title=f"Exchange Rate: {rate.source} → {rate.target}")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value", style="green")
-        table.add_row("Rate", str(rate.rate))
-        table.add_row("Timestamp", rate.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"))
-        table.add_row("Source", f"{rate.source} ({rate.source_name or 'Unknown'})")
-        table.add_row("Target", f"{rate.target} ({rate.target_name or 'Unknown'})")
-        console.print(table)
+        sys.stdout.write(json_dumps(data, indent=True) + "\n")
+    else:  # csv
+        import csv
+
+        csv.writer(sys.stdout, lineterminator="\n").writerow(
+            (rate.source, rate.target, rate.rate, rate.timestamp.isoformat())
+        )
+    sys.stdout.flush()
 
 
 @cli.command()
@@ -263,65 +518,55 @@ async def history(
 @async_command
 async def export(app: WiseRateApp, ctx: Any, format: str) -> None:
     """Export all data (rates and alerts) in various formats."""
-    # Get all alerts
-    alerts_text = await app.list_alerts()
+    if format == "table":
+        _console().print(await app.list_alerts())
+        return
 
+    # Machine-readable formats go straight to stdout, bypassing rich
     if format == "json":
-        import json
+        from .utils import json_dumps
 
         data = {
-            "alerts": alerts_text,
+            "alerts": [alert.model_dump(mode="json") for alert in app.get_alerts()],
             "exported_at": datetime.now().isoformat(),
         }
-        console.print(json.dumps(data, indent=2))
-    elif format == "csv":
-        console.print("type,source,target,threshold,is_above,enabled,created_at")
-        # Parse alerts text to CSV (improved parsing)
-        if "No active alerts" not in alerts_text:
-            lines = alerts_text.split("\n")
-            # Skip header lines (usually first 2-3 lines)
-            for line in lines:
-                if line.startswith("•"):
-                    # Parse alert line format: "• EUR/USD: above 1.05 (enabled)"
-                    parts = line.replace("• ", "").split(":")
-                    if len(parts) == 2:
-                        pair_info = parts[0].strip()  # "EUR/USD"
-                        status_info = parts[1].strip()  # "above 1.05 (enabled)"
-
-                        if "/" in pair_info:
-                            source, target = pair_info.split("/")
-                            # Parse status: "above 1.05 (enabled)"
-                            status_parts = status_info.split()
-                            if len(status_parts) >= 3:
-                                direction = status_parts[0]  # "above" or "below"
-                                threshold = status_parts[1]  # "1.05"
-                                enabled = "enabled" in status_info
-                                is_above = direction == "above"
-
-                                console.print(
-                                    f"alert,{source},{target},{threshold},{is_above},{enabled},"
-                                )
-    else:  # table
-        console.print(alerts_text)
+        sys.stdout.write(json_dumps(data, indent=True) + "\n")
+    else:  # csv
+        import csv
+
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(
+            ["type", "source", "target", "threshold", "is_above", "enabled", "created_at"]
+        )
+        writer.writerows(
+            [
+                "alert",
+                alert.currency_pair.source,
+                alert.currency_pair.target,
+                alert.threshold,
+                alert.is_above,
+                alert.enabled,
+                alert.created_at.isoformat(),
+            ]
+            for alert in app.get_alerts()
+        )
+    sys.stdout.flush()
 
 
 @cli.command()
-@click.argument("currency", type=str)
+@click.argument("currency", type=_CURRENCY)
 @click.pass_context
 def validate_currency(ctx: Any, currency: str) -> None:
     """Validate a currency code."""
-    from .utils import get_currency_name, validate_currency_code
-
-    currency_upper = currency.upper()
-    is_valid = validate_currency_code(currency_upper)
-    currency_name = get_currency_name(currency_upper)
+    console = _console()
+    is_valid, currency_name = _currency_info(currency)
 
     if is_valid:
-        console.print(f"[green]✓ {currency_upper} is a valid currency code[/green]")
+        console.print(f"[green]✓ {currency} is a valid currency code[/green]")
         if currency_name:
             console.print(f"[blue]Currency: {currency_name}[/blue]")
     else:
-        console.print(f"[red]✗ {currency_upper} is not a valid currency code[/red]")
+        console.print(f"[red]✗ {currency} is not a valid currency code[/red]")
         console.print(
             "[yellow]Tip: Use 3-letter ISO 4217 currency codes (e.g., USD, EUR, GBP)[/yellow]"
         )
@@ -331,231 +576,328 @@ def validate_currency(ctx: Any, currency: str) -> None:
 @click.pass_context
 def currencies(ctx: Any) -> None:
     """List all supported currency codes."""
-    from .utils import EXTENDED_CURRENCIES, get_currency_name
+    console = _console()
+    if not console.is_terminal:
+        # Piped output: plain tab-separated lines, no table layout
+        _write_plain_currencies(_sorted_currencies())
+        return
+
+    console.print(_currencies_table())
 
-    table = Table(title="Supported Currencies")
-    table.add_column("Code", style="cyan")
-    table.add_column("Name", style="green")
 
-    for currency in sorted(EXTENDED_CURRENCIES):
-        name = get_currency_name(currency) or "Unknown"
-        table.add_row(currency, name)
+async def _refresh_rates_periodically(app: WiseRateApp, interval: int) -> None:
+    """Update all rates every `interval` seconds until cancelled."""
+    import asyncio
 
-    console.print(table)
+    while True:
+        await asyncio.sleep(interval)
+        await app.update_all_rates()
 
 
 @cli.command()
+@click.option(
+    "--refresh-interval",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Refresh all rates in the background every N seconds (0 disables)",
+)
 @click.pass_context
-def interactive(ctx: Any) -> None:
+def interactive(ctx: Any, refresh_interval: int) -> None:
     """Start interactive mode for WiseRate."""
+    from .app import WiseRateApp
+
+    console = _console()
+
     settings = ctx.obj["settings"]
 
-    async def run() -> None:
-        app = WiseRateApp(settings)
-        await app.start()
+    # Input is read on this thread and each command runs on the shared loop
+    # thread, so Ctrl+C can interrupt both the prompt and a running command.
+    # That leaves the loop free to refresh rates while the user types.
+    app = WiseRateApp(settings)
+    run_sync(app.start())
+    refresh = (
+        spawn(_refresh_rates_periodically(app, refresh_interval)) if refresh_interval else None
+    )
 
-        try:
-            console.print("[bold blue]Welcome to WiseRate Interactive Mode![/bold blue]")
-            console.print("[yellow]Type 'help' for available commands, 'quit' to exit[/yellow]\n")
+    try:
+        console.print(
+            "[bold blue]Welcome to WiseRate Interactive Mode![/bold blue]",
+            "[yellow]Type 'help' for available commands, 'quit' to exit[/yellow]\n",
+            sep="\n",
+        )
 
-            while True:
-                try:
-                    command = console.input("[bold green]WiseRate> [/bold green]").strip()
+        while True:
+            try:
+                command = console.input("[bold green]WiseRate> [/bold green]").strip()
+
+                if not command:
+                    continue
+
+                # Single-word commands that need no tokenizing or dispatch
+                lowered = command.lower()
+                if lowered in _QUIT_COMMANDS:
+                    console.print("[yellow]Goodbye![/yellow]")
+                    break
+                if lowered == "help":
+                    show_interactive_help()
+                    continue
+
+                # Parse and execute command
+                run_sync(execute_interactive_command(app, settings, command))
+
+            except EOFError:
+                console.print("\n[yellow]Goodbye![/yellow]")
+                break
+            except KeyboardInterrupt:
+                console.print("\n[yellow]Use 'quit' to exit[/yellow]")
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
 
-                    if not command:
-                        continue
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        ctx.exit(1)
+    finally:
+        # Let the refresh finish unwinding before stop() closes the HTTP client
+        if refresh is not None:
+            cancel(refresh)
+        run_sync(app.stop())
 
-                    if command.lower() in ["quit", "exit", "q"]:
-                        console.print("[yellow]Goodbye![/yellow]")
-                        break
 
-                    # Parse and execute command
-                    await execute_interactive_command(app, settings, command)
+def _partition_flags(tokens: list[str]) -> tuple[list[str], frozenset[str]]:
+    """Split command tokens into positional arguments and a set of flags.
 
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Use 'quit' to exit[/yellow]")
-                except Exception as e:
-                    console.print(f"[red]Error: {e}[/red]")
+    Flags may appear anywhere in the command, e.g. `rate --update EUR USD`.
+    """
+    positional: list[str] = []
+    flags: list[str] = []
+    for token in tokens:
+        (flags if token.startswith("-") else positional).append(token)
+    return positional, frozenset(flags)
 
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
-            sys.exit(1)
-        finally:
-            await app.stop()
 
-    asyncio.run(run())
+@cli.command()
+@click.pass_context
+def batch(ctx: Any) -> None:
+    """Run interactive-mode commands read from stdin, one per line.
 
+    All commands share one event loop and one application instance, e.g.
+    `printf 'rate USD EUR\\nrate GBP USD\\n' | wiserate batch`.
+    """
+    run_sync(_batch_main(ctx.obj["settings"]))
 
-async def execute_interactive_command(app: WiseRateApp, settings: Settings, command: str) -> None:
-    """Execute a command in interactive mode with improved parsing and validation."""
-    parts = command.split()
-    cmd = parts[0].lower() if parts else ""
+
+async def _aiter_stdin() -> AsyncIterator[str]:
+    """Yield stripped lines from stdin without blocking the event loop."""
+    import asyncio
+
+    # Resolved once rather than per line as asyncio.to_thread() would
+    run_in_executor = asyncio.get_running_loop().run_in_executor
+    readline = sys.stdin.readline
+    while line := await run_in_executor(None, readline):
+        yield line.strip()
+
+
+async def _batch_main(settings: Settings) -> None:
+    """Execute each stdin line as an interactive command on a single app."""
+    async with app_context(settings) as app:
+        async for command in _aiter_stdin():
+            if command and not command.startswith("#"):
+                await execute_interactive_command(app, settings, command)
+
+
+async def _interactive_help(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Show the interactive help table."""
+    show_interactive_help()
+
+
+async def _interactive_rate(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `rate <source> <target> [--update]`."""
+    console = _console()
+    if len(parts) < 3:
+        console.print("[red]Usage: rate <source> <target> [--update][/red]")
+        return
+
+    source, target = parts[1].upper(), parts[2].upper()
+    update = "--update" in flags or "-u" in flags
+
+    rate = await app.get_exchange_rate(source, target, update)
+    console.print(f"[green]1 {rate.source} = {rate.rate} {rate.target}[/green]")
+    if rate.source_name and rate.target_name:
+        console.print(f"[blue]{rate.source_name} → {rate.target_name}[/blue]")
+
+
+async def _interactive_alert(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `alert <source> <target> <threshold> [--below]`."""
+    console = _console()
+    if len(parts) < 4:
+        console.print("[red]Usage: alert <source> <target> <threshold> [--below][/red]")
+        return
+
+    source, target, threshold_str = parts[1].upper(), parts[2].upper(), parts[3]
+    is_below = "--below" in flags
 
     try:
-        if cmd == "help":
-            show_interactive_help()
+        threshold = Decimal(threshold_str)
+    except InvalidOperation:
+        console.print(f"[red]Invalid threshold value: {threshold_str}[/red]")
+        return
+
+    is_above = not is_below
+    success = await app.set_alert(source, target, threshold, is_above)
+
+    if success:
+        direction = "below" if is_below else "above"
+        console.print(f"[green]Alert set: 1 {source} {direction} {threshold} {target}[/green]")
+    else:
+        console.print("[red]Failed to set alert[/red]")
+
+
+async def _interactive_remove_alert(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `remove-alert <source> <target>`."""
+    console = _console()
+    if len(parts) < 3:
+        console.print("[red]Usage: remove-alert <source> <target>[/red]")
+        return
+
+    source, target = parts[1].upper(), parts[2].upper()
+    success = await app.remove_alert(source, target)
+
+    if success:
+        console.print(f"[green]Alert removed for {source}/{target}[/green]")
+    else:
+        console.print(f"[yellow]No alert found for {source}/{target}[/yellow]")
+
+
+async def _interactive_alerts(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `alerts`."""
+    _console().print(await app.list_alerts())
+
+
+async def _interactive_currencies(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `currencies [page]`."""
+    console = _console()
+
+    # Allow pagination: currencies [page]
+    page = 1
+    if len(parts) > 1:
+        try:
+            page = int(parts[1])
+        except ValueError:
+            console.print("[red]Invalid page number[/red]")
             return
 
-        elif cmd == "rate":
-            if len(parts) < 3:
-                console.print("[red]Usage: rate <source> <target> [--update][/red]")
-                return
+    total_pages = _currency_page_count()
+    if page < 1 or page > total_pages:
+        console.print(f"[red]Page {page} not found. Total pages: {total_pages}[/red]")
+        return
 
-            source, target = parts[1].upper(), parts[2].upper()
-            update = "--update" in parts or "-u" in parts
+    if not console.is_terminal:
+        _write_plain_currencies(_currency_page(page))
+        return
 
-            rate = await app.get_exchange_rate(source, target, update)
-            console.print(f"[green]1 {rate.source} = {rate.rate} {rate.target}[/green]")
-            if rate.source_name and rate.target_name:
-                console.print(f"[blue]{rate.source_name} → {rate.target_name}[/blue]")
+    console.print(_currencies_table(page))
 
-        elif cmd == "alert":
-            if len(parts) < 4:
-                console.print("[red]Usage: alert <source> <target> <threshold> [--below][/red]")
-                return
 
-            source, target, threshold_str = parts[1].upper(), parts[2].upper(), parts[3]
-            is_below = "--below" in parts
+async def _interactive_validate(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `validate <currency>`."""
+    console = _console()
+    if len(parts) < 2:
+        console.print("[red]Usage: validate <currency>[/red]")
+        return
 
-            try:
-                threshold = Decimal(threshold_str)
-            except ValueError:
-                console.print(f"[red]Invalid threshold value: {threshold_str}[/red]")
-                return
+    currency = parts[1].upper()
+    is_valid, currency_name = _currency_info(currency)
 
-            is_above = not is_below
-            success = await app.set_alert(source, target, threshold, is_above)
+    if is_valid:
+        console.print(f"[green]✓ {currency} is a valid currency code[/green]")
+        if currency_name:
+            console.print(f"[blue]Currency: {currency_name}[/blue]")
+    else:
+        console.print(f"[red]✗ {currency} is not a valid currency code[/red]")
+        console.print("[yellow]Tip: Use 3-letter ISO 4217 currency codes[/yellow]")
 
-            if success:
-                direction = "below" if is_below else "above"
-                console.print(
-                    f"[green]Alert set: 1 {source} {direction} {threshold} {target}[/green]"
-                )
-            else:
-                console.print("[red]Failed to set alert[/red]")
-
-        elif cmd == "remove-alert":
-            if len(parts) < 3:
-                console.print("[red]Usage: remove-alert <source> <target>[/red]")
-                return
-
-            source, target = parts[1].upper(), parts[2].upper()
-            success = await app.remove_alert(source, target)
-
-            if success:
-                console.print(f"[green]Alert removed for {source}/{target}[/green]")
-            else:
-                console.print(f"[yellow]No alert found for {source}/{target}[/yellow]")
-
-        elif cmd == "alerts":
-            alerts_text = await app.list_alerts()
-            console.print(alerts_text)
-
-        elif cmd == "currencies":
-            from .utils import EXTENDED_CURRENCIES, get_currency_name
-
-            # Allow pagination: currencies [page]
-            page = 1
-            if len(parts) > 1:
-                try:
-                    page = int(parts[1])
-                except ValueError:
-                    console.print("[red]Invalid page number[/red]")
-                    return
-
-            currencies_per_page = 20
-            start_idx = (page - 1) * currencies_per_page
-            end_idx = start_idx + currencies_per_page
-
-            sorted_currencies = sorted(EXTENDED_CURRENCIES)
-            total_pages = (len(sorted_currencies) + currencies_per_page - 1) // currencies_per_page
-
-            if page < 1 or page > total_pages:
-                console.print(f"[red]Page {page} not found. Total pages: {total_pages}[/red]")
-                return
-
-            table = Table(title=f"Supported Currencies (Page {page}/{total_pages})")
-            table.add_column("Code", style="cyan")
-            table.add_column("Name", style="green")
-
-            for currency in sorted_currencies[start_idx:end_idx]:
-                name = get_currency_name(currency) or "Unknown"
-                table.add_row(currency, name)
-
-            console.print(table)
-
-        elif cmd == "validate":
-            if len(parts) < 2:
-                console.print("[red]Usage: validate <currency>[/red]")
-                return
-
-            currency = parts[1].upper()
-            from .utils import get_currency_name, validate_currency_code
-
-            is_valid = validate_currency_code(currency)
-            currency_name = get_currency_name(currency)
-
-            if is_valid:
-                console.print(f"[green]✓ {currency} is a valid currency code[/green]")
-                if currency_name:
-                    console.print(f"[blue]Currency: {currency_name}[/blue]")
-            else:
-                console.print(f"[red]✗ {currency} is not a valid currency code[/red]")
-                console.print("[yellow]Tip: Use 3-letter ISO 4217 currency codes[/yellow]")
-
-        elif cmd == "config":
-            table = Table(title="Configuration")
-            table.add_column("Setting", style="cyan")
-            table.add_column("Value", style="green")
-
-            table.add_row("API URL", settings.api_url)
-            table.add_row("Data Directory", str(settings.data_dir))
-            table.add_row("Cache TTL", f"{settings.cache_ttl}s")
-            table.add_row("Log Level", settings.log_level)
-            table.add_row("Max Requests/Min", str(settings.max_requests_per_minute))
-
-            console.print(table)
-
-        elif cmd == "update":
-            console.print("[yellow]Updating all currency rates...[/yellow]")
-            await app.update_all_rates()
-            console.print("[green]All currency rates updated[/green]")
-
-        elif cmd == "clear":
-            console.print("[yellow]Clear command not implemented yet[/yellow]")
 
-        else:
-            console.print(f"[yellow]Unknown command: {cmd}[/yellow]")
-            console.print("[yellow]Type 'help' for available commands[/yellow]")
+async def _interactive_config(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `config`."""
+    _console().print(_config_table(settings))
+
+
+async def _interactive_update(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `update`."""
+    console = _console()
+    console.print("[yellow]Updating all currency rates...[/yellow]")
+    await app.update_all_rates()
+    console.print("[green]All currency rates updated[/green]")
+
 
+async def _interactive_clear(
+    app: WiseRateApp, settings: Settings, parts: list[str], flags: frozenset[str]
+) -> None:
+    """Handle `clear`."""
+    _console().print("[yellow]Clear command not implemented yet[/yellow]")
+
+
+type _InteractiveHandler = Callable[
+    [WiseRateApp, Settings, list[str], frozenset[str]], Awaitable[None]
+]
+
+# Interactive command name -> handler, resolved with a single dict lookup per command
+_INTERACTIVE_HANDLERS: dict[str, _InteractiveHandler] = {
+    "help": _interactive_help,
+    "rate": _interactive_rate,
+    "alert": _interactive_alert,
+    "remove-alert": _interactive_remove_alert,
+    "alerts": _interactive_alerts,
+    "currencies": _interactive_currencies,
+    "validate": _interactive_validate,
+    "config": _interactive_config,
+    "update": _interactive_update,
+    "clear": _interactive_clear,
+}
+
+
+async def execute_interactive_command(app: WiseRateApp, settings: Settings, command: str) -> None:
+    """Execute a command in interactive mode with improved parsing and validation."""
+    parts, flags = _partition_flags(command.split())
+    cmd = parts[0].lower() if parts else ""
+
+    handler = _INTERACTIVE_HANDLERS.get(cmd)
+    if handler is None:
+        _console().print(
+            f"[yellow]Unknown command: {cmd}[/yellow]",
+            "[yellow]Type 'help' for available commands[/yellow]",
+            sep="\n",
+        )
+        return
+
+    try:
+        await handler(app, settings, parts, flags)
     except Exception as e:
-        console.print(f"[red]Error executing command '{cmd}': {e}[/red]")
+        _console().print(f"[red]Error executing command '{cmd}': {e}[/red]")
 
 
 def show_interactive_help() -> None:
     """Show comprehensive help for interactive mode."""
-    help_table = Table(title="WiseRate Interactive Mode - Available Commands")
-    help_table.add_column("Command", style="cyan", no_wrap=True)
-    help_table.add_column("Description", style="green")
-    help_table.add_column("Example", style="yellow")
-
-    help_table.add_row("rate <src> <tgt> [--update]", "Get exchange rate", "rate EUR USD")
-    help_table.add_row(
-        "alert <src> <tgt> <thresh> [--below]", "Set price alert", "alert EUR USD 1.05"
-    )
-    help_table.add_row("remove-alert <src> <tgt>", "Remove alert", "remove-alert EUR USD")
-    help_table.add_row("alerts", "List all alerts", "alerts")
-    help_table.add_row("currencies [page]", "List currencies", "currencies 2")
-    help_table.add_row("validate <currency>", "Validate currency code", "validate EUR")
-    help_table.add_row("update", "Update all rates", "update")
-    help_table.add_row("config", "Show configuration", "config")
-    help_table.add_row("help", "Show this help", "help")
-    help_table.add_row("quit", "Exit interactive mode", "quit")
-
-    console.print(help_table)
-    console.print("\n[yellow]Options:[/yellow]")
-    console.print("  --update, -u    Update cache before getting rate")
-    console.print("  --below         Alert when rate goes below threshold")
+    _console().print(_help_table(), _HELP_OPTIONS, sep="\n")
 
 
 def main() -> None:
@@ -18,12 +18,17 @@ Configuration can be provided via:
 
 import contextlib
 import os
+from collections.abc import Callable
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from .constants import (
+    DEFAULT_CACHE_STALE_TTL,
     DEFAULT_CACHE_TTL,
+    DEFAULT_DATA_DIR,
     DEFAULT_LOG_LEVEL,
     DEFAULT_MAX_REQUESTS_PER_MINUTE,
     MAX_CACHE_TTL,
@@ -31,8 +36,89 @@ from .constants import (
     MIN_CACHE_TTL,
     MIN_REQUESTS_PER_MINUTE,
     SUPPORTED_LOG_LEVELS,
+    SUPPORTED_LOG_LEVELS_DISPLAY,
 )
 
+ENV_PREFIX = "WISERATE_"
+
+# Resolved once at import; Path.home() reads the environment on every call
+_DEFAULT_DATA_DIR = Path.home() / DEFAULT_DATA_DIR
+
+# Validation messages that only depend on constants
+_LOG_LEVEL_ERROR = f"Log level must be one of: {', '.join(SUPPORTED_LOG_LEVELS_DISPLAY)}"
+_CACHE_TTL_RANGE_ERROR = f"Cache TTL must be between {MIN_CACHE_TTL} and {MAX_CACHE_TTL} seconds"
+_CACHE_STALE_TTL_RANGE_ERROR = f"Cache stale TTL must be between 0 and {MAX_CACHE_TTL} seconds"
+_MAX_REQUESTS_RANGE_ERROR = (
+    f"Max requests per minute must be between "
+    f"{MIN_REQUESTS_PER_MINUTE} and {MAX_REQUESTS_PER_MINUTE}"
+)
+
+# Settings file-path properties cached per instance and derived from data_dir
+_DATA_PATH_ATTRS = ("currencies_file", "alerts_file", "log_file")
+
+# Environment variables read by Settings: (variable, field, parser)
+_ENV_SPEC: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("WISERATE_API_URL", "api_url", str),
+    ("WISERATE_DATA_DIR", "data_dir", Path),
+    ("WISERATE_CACHE_TTL", "cache_ttl", int),
+    ("WISERATE_CACHE_STALE_TTL", "cache_stale_ttl", int),
+    ("WISERATE_LOG_LEVEL", "log_level", str),
+    ("WISERATE_MAX_REQUESTS_PER_MINUTE", "max_requests_per_minute", int),
+)
+
+# Data directories already created by this process
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process.
+
+    Args:
+        path: Directory to create (parents included)
+    """
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def _env_snapshot() -> tuple[tuple[str, str], ...]:
+    """Return the WISERATE_* environment variables as a hashable cache key."""
+    return tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith(ENV_PREFIX)))
+
+
+@lru_cache(maxsize=1)
+def _parse_env(env: tuple[tuple[str, str], ...]) -> dict:
+    """Parse WISERATE_* variables into Settings arguments, once per environment.
+
+    Callers must not mutate the returned dict; it is shared between calls.
+
+    Args:
+        env: Snapshot of the WISERATE_* variables from _env_snapshot()
+
+    Returns:
+        Dictionary of configuration values from environment variables
+    """
+    values = dict(env)
+    config: dict = {}
+
+    for env_name, field_name, parser in _ENV_SPEC:
+        # Empty values are treated as unset
+        if raw := values.get(env_name):
+            # Unparseable numbers fall back to the field default
+            with contextlib.suppress(ValueError):
+                config[field_name] = parser(raw)
+
+    return config
+
+
+@lru_cache(maxsize=4)
+def _load_settings(env: tuple[tuple[str, str], ...]) -> Settings:
+    """Build settings for an environment snapshot; see get_settings()."""
+    if not env:
+        return Settings.fast_default()
+    return Settings()
+
 
 class Settings(BaseModel):
     """Application settings for WiseRate.
@@ -48,6 +134,8 @@ class Settings(BaseModel):
         api_url: Base URL for free exchange rate API
         data_dir: Directory for storing cache and configuration files
         cache_ttl: How long to cache exchange rates (seconds)
+        cache_stale_ttl: How long past cache_ttl an expired rate is still served
+            while it is refreshed in the background (seconds, 0 disables)
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         max_requests_per_minute: Rate limiting for API requests
 
@@ -55,6 +143,7 @@ class Settings(BaseModel):
         WISERATE_API_URL: Override API URL
         WISERATE_DATA_DIR: Override data directory
         WISERATE_CACHE_TTL: Override cache TTL (seconds)
+        WISERATE_CACHE_STALE_TTL: Override stale-while-revalidate window (seconds)
         WISERATE_LOG_LEVEL: Override log level
         WISERATE_MAX_REQUESTS_PER_MINUTE: Override rate limit
 
@@ -84,29 +173,40 @@ class Settings(BaseModel):
     api_url: str = Field(default="https://api.exchangerate-api.com/v4")
 
     # Application settings
-    data_dir: Path = Field(default=Path.home() / ".wiserate")
+    data_dir: Path = Field(default=_DEFAULT_DATA_DIR)
     cache_ttl: int = Field(default=DEFAULT_CACHE_TTL)
+    cache_stale_ttl: int = Field(default=DEFAULT_CACHE_STALE_TTL)
     log_level: str = Field(default=DEFAULT_LOG_LEVEL)
 
     # Rate limiting
     max_requests_per_minute: int = Field(default=DEFAULT_MAX_REQUESTS_PER_MINUTE)
 
-    @model_validator(mode="after")
-    def validate_settings(self) -> Settings:
-        """Validate all settings after model creation.
+    @model_validator(mode="before")
+    @classmethod
+    def validate_settings(cls, data: Any) -> Any:
+        """Validate and normalize the checked fields in a single pass.
+
+        One model-level validator replaces a validator per field, so pydantic
+        calls back into Python once per construction or assignment. The
+        fields it checks are listed in ``_FIELD_VALIDATORS``.
 
-        This method is called after all field validation and can perform
-        cross-field validation if needed.
+        Args:
+            data: Raw input values (a dict for construction and assignment)
 
         Returns:
-            The validated Settings instance
+            The input values with log level, cache TTL and rate limit normalized
         """
-        # Additional validation if needed
-        return self
+        if not isinstance(data, dict):
+            return data
 
-    @field_validator("log_level", mode="before")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
+        data = dict(data)
+        for name, validate in _FIELD_VALIDATORS.items():
+            if name in data:
+                data[name] = validate(data[name])
+        return data
+
+    @staticmethod
+    def validate_log_level(v: str) -> str:
         """Validate and normalize log level.
 
         Args:
@@ -118,15 +218,19 @@ class Settings(BaseModel):
         Raises:
             ValueError: If the log level is not supported
         """
-        if isinstance(v, str):
-            v = v.upper()
+        # Checked first so unhashable input fails validation rather than the set lookup
+        if not isinstance(v, str):
+            raise ValueError(_LOG_LEVEL_ERROR)
+        # Levels are usually given uppercase already; only upper() on a miss
+        if v in SUPPORTED_LOG_LEVELS:
+            return v
+        v = v.upper()
         if v not in SUPPORTED_LOG_LEVELS:
-            raise ValueError(f"Log level must be one of: {', '.join(SUPPORTED_LOG_LEVELS)}")
+            raise ValueError(_LOG_LEVEL_ERROR)
         return v
 
-    @field_validator("cache_ttl", mode="before")
-    @classmethod
-    def validate_cache_ttl(cls, v: str | int) -> int:
+    @staticmethod
+    def validate_cache_ttl(v: str | int) -> int:
         """Validate cache TTL value.
 
         Args:
@@ -146,14 +250,34 @@ class Settings(BaseModel):
                 raise ValueError(f"Cache TTL must be a valid integer, got: {v}")
 
         if not MIN_CACHE_TTL <= v <= MAX_CACHE_TTL:
-            raise ValueError(
-                f"Cache TTL must be between {MIN_CACHE_TTL} and {MAX_CACHE_TTL} seconds"
-            )
+            raise ValueError(_CACHE_TTL_RANGE_ERROR)
         return v
 
-    @field_validator("max_requests_per_minute", mode="before")
-    @classmethod
-    def validate_max_requests(cls, v: str | int) -> int:
+    @staticmethod
+    def validate_cache_stale_ttl(v: str | int) -> int:
+        """Validate the stale-while-revalidate window.
+
+        Args:
+            v: The stale window in seconds (can be string or int)
+
+        Returns:
+            The validated stale window
+
+        Raises:
+            ValueError: If the value is invalid or out of range
+        """
+        if isinstance(v, str):
+            try:
+                v = int(v)
+            except ValueError:
+                raise ValueError(f"Cache stale TTL must be a valid integer, got: {v}")
+
+        if not 0 <= v <= MAX_CACHE_TTL:
+            raise ValueError(_CACHE_STALE_TTL_RANGE_ERROR)
+        return v
+
+    @staticmethod
+    def validate_max_requests(v: str | int) -> int:
         """Validate max requests per minute value.
 
         Args:
@@ -173,10 +297,7 @@ class Settings(BaseModel):
                 raise ValueError(f"Max requests per minute must be a valid integer, got: {v}")
 
         if not MIN_REQUESTS_PER_MINUTE <= v <= MAX_REQUESTS_PER_MINUTE:
-            raise ValueError(
-                f"Max requests per minute must be between "
-                f"{MIN_REQUESTS_PER_MINUTE} and {MAX_REQUESTS_PER_MINUTE}"
-            )
+            raise ValueError(_MAX_REQUESTS_RANGE_ERROR)
         return v
 
     def __init__(self, **kwargs: object) -> None:
@@ -190,6 +311,7 @@ class Settings(BaseModel):
             **kwargs: Settings to override. Supported keys:
                 - api_url: API URL for exchange rates
                 - cache_ttl: Cache TTL in seconds
+                - cache_stale_ttl: Stale-while-revalidate window in seconds
                 - log_level: Logging level
                 - max_requests_per_minute: Rate limiting value
                 - data_dir: Data directory path
@@ -203,8 +325,17 @@ class Settings(BaseModel):
         # Call parent constructor with merged values
         super().__init__(**merged_config)
 
-        # Ensure data directory exists
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def fast_default(cls) -> Settings:
+        """Return the built-in default settings without running validation.
+
+        The defaults are known to be valid, so this is only safe when nothing
+        (environment or arguments) overrides them.
+
+        Returns:
+            A Settings instance holding the default values
+        """
+        return cls.model_construct()
 
     @staticmethod
     def _load_from_env() -> dict:
@@ -213,33 +344,30 @@ class Settings(BaseModel):
         Returns:
             Dictionary of configuration values from environment variables
         """
-        config: dict = {}
-
-        # API URL
-        if api_url := os.getenv("WISERATE_API_URL"):
-            config["api_url"] = api_url
-
-        # Data directory
-        if data_dir := os.getenv("WISERATE_DATA_DIR"):
-            config["data_dir"] = Path(data_dir)
-
-        # Cache TTL
-        if cache_ttl := os.getenv("WISERATE_CACHE_TTL"):
-            with contextlib.suppress(ValueError):
-                config["cache_ttl"] = int(cache_ttl)
-
-        # Log level
-        if log_level := os.getenv("WISERATE_LOG_LEVEL"):
-            config["log_level"] = log_level
-
-        # Max requests per minute
-        if max_requests := os.getenv("WISERATE_MAX_REQUESTS_PER_MINUTE"):
-            with contextlib.suppress(ValueError):
-                config["max_requests_per_minute"] = int(max_requests)
-
-        return config
+        return _parse_env(_env_snapshot())
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set a field, dropping cached file paths when the data directory changes."""
+        super().__setattr__(name, value)
+        validate = _FIELD_VALIDATORS.get(name)
+        if validate is not None:
+            # Pydantic validates assignments with the model validator but
+            # discards its return value, so store the normalized value here.
+            self.__dict__[name] = validate(value)
+        elif name == "data_dir":
+            for attr in _DATA_PATH_ATTRS:
+                self.__dict__.pop(attr, None)
+
+    def _data_path(self, name: str) -> Path:
+        """Return a file path inside the data directory, creating the directory on first use.
+
+        The directory isn't created up front so commands that only display
+        settings never touch the filesystem.
+        """
+        _ensure_dir(self.data_dir)
+        return self.data_dir / name
 
-    @property
+    @cached_property
     def currencies_file(self) -> Path:
         """Get the path to the currencies cache file.
 
@@ -248,9 +376,9 @@ class Settings(BaseModel):
         Returns:
             Path to the currencies.json cache file
         """
-        return self.data_dir / "currencies.json"
+        return self._data_path("currencies.json")
 
-    @property
+    @cached_property
     def alerts_file(self) -> Path:
         """Get the path to the alerts configuration file.
 
@@ -259,9 +387,9 @@ class Settings(BaseModel):
         Returns:
             Path to the alerts.json configuration file
         """
-        return self.data_dir / "alerts.json"
+        return self._data_path("alerts.json")
 
-    @property
+    @cached_property
     def log_file(self) -> Path:
         """Get the path to the application log file.
 
@@ -270,4 +398,35 @@ class Settings(BaseModel):
         Returns:
             Path to the wiserate.log file
         """
-        return self.data_dir / "wiserate.log"
+        return self._data_path("wiserate.log")
+
+
+# Fields normalized by Settings.validate_settings, with the validator for each
+_FIELD_VALIDATORS: dict[str, Callable[[Any], Any]] = {
+    "log_level": Settings.validate_log_level,
+    "cache_ttl": Settings.validate_cache_ttl,
+    "cache_stale_ttl": Settings.validate_cache_stale_ttl,
+    "max_requests_per_minute": Settings.validate_max_requests,
+}
+
+
+def get_settings() -> Settings:
+    """Return the process-wide settings for the current environment.
+
+    Repeated calls with the same WISERATE_* variables return the same
+    instance instead of re-running validation.
+
+    Returns:
+        The shared Settings instance for the current environment
+    """
+    return _load_settings(_env_snapshot())
+
+
+def reload_settings() -> Settings:
+    """Discard cached settings and load them again from the environment.
+
+    Returns:
+        A freshly validated Settings instance
+    """
+    _load_settings.cache_clear()
+    return get_settings()
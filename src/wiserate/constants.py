@@ -1,14 +1,20 @@
 """Constants for WiseRate application."""
 
+from types import MappingProxyType
+
 # API Configuration
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY = 1.0
+MAX_CONCURRENT_REQUESTS = 10  # Matches the HTTP client's connection pool size
 
 # Cache Configuration
 DEFAULT_CACHE_TTL = 3600  # 1 hour
 MAX_CACHE_TTL = 86400  # 24 hours
 MIN_CACHE_TTL = 60  # 1 minute
+DEFAULT_CACHE_STALE_TTL = 600  # Serve expired rates for 10 more minutes while refreshing
+CACHE_FLUSH_DELAY = 1.0  # Seconds to coalesce rate cache writes before saving
+CACHE_MAX_ENTRIES = 1024  # Rates kept in memory; least recently used are evicted
 
 # Rate Limiting
 DEFAULT_MAX_REQUESTS_PER_MINUTE = 60
@@ -28,21 +34,25 @@ LOG_FILE = "wiserate.log"
 
 # Logging
 DEFAULT_LOG_LEVEL = "INFO"
-SUPPORTED_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-
-# Currency Precision
-CURRENCY_PRECISION = {
-    "JPY": 0,
-    "KRW": 0,
-    "IDR": 0,
-    "VND": 0,
-    "BYN": 0,  # No decimals
-    "BHD": 3,
-    "IQD": 3,
-    "JOD": 3,
-    "KWD": 3,
-    "LYD": 3,
-    "OMR": 3,
-    "TND": 3,  # 3 decimals
-    "DEFAULT": 2,  # Standard 2 decimals
-}
+SUPPORTED_LOG_LEVELS_DISPLAY = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+SUPPORTED_LOG_LEVELS = frozenset(SUPPORTED_LOG_LEVELS_DISPLAY)
+
+# Currency Precision (read-only)
+CURRENCY_PRECISION = MappingProxyType(
+    {
+        "JPY": 0,
+        "KRW": 0,
+        "IDR": 0,
+        "VND": 0,
+        "BYN": 0,  # No decimals
+        "BHD": 3,
+        "IQD": 3,
+        "JOD": 3,
+        "KWD": 3,
+        "LYD": 3,
+        "OMR": 3,
+        "TND": 3,  # 3 decimals
+        "DEFAULT": 2,  # Standard 2 decimals
+    }
+)
+CURRENCY_PRECISION_GET = CURRENCY_PRECISION.get
@@ -26,6 +26,8 @@ class WiseRateError(Exception):
         details: Optional additional details about the error
     """
 
+    __slots__ = ("message", "details", "_str")
+
     def __init__(self, message: str, details: str | None = None) -> None:
         """Initialize the exception with a message and optional details.
 
@@ -35,13 +37,13 @@ class WiseRateError(Exception):
         """
         self.message = message
         self.details = details
+        # Formatted once; errors are often stringified repeatedly when logged
+        self._str = f"{message}: {details}" if details else message
         super().__init__(message)
 
     def __str__(self) -> str:
         """Return string representation of the error."""
-        if self.details:
-            return f"{self.message}: {self.details}"
-        return self.message
+        return self._str
 
 
 class ConfigurationError(WiseRateError):
@@ -55,7 +57,7 @@ class ConfigurationError(WiseRateError):
         >>> raise ConfigurationError("Invalid cache TTL", details="Must be between 60 and 86400")
     """
 
-    pass
+    __slots__ = ()
 
 
 class APIError(WiseRateError):
@@ -69,6 +71,8 @@ class APIError(WiseRateError):
         response_text: API response text if available
     """
 
+    __slots__ = ("status_code", "response_text")
+
     def __init__(
         self,
         message: str,
@@ -102,7 +106,7 @@ class ValidationError(WiseRateError):
         ... )
     """
 
-    pass
+    __slots__ = ()
 
 
 class CacheError(WiseRateError):
@@ -116,7 +120,7 @@ class CacheError(WiseRateError):
         >>> raise CacheError("Failed to load cache", details="JSON decode error")
     """
 
-    pass
+    __slots__ = ()
 
 
 class AlertError(WiseRateError):
@@ -130,7 +134,7 @@ class AlertError(WiseRateError):
         >>> raise AlertError("Failed to save alert", details="Permission denied")
     """
 
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(WiseRateError):
@@ -143,6 +147,8 @@ class RateLimitError(WiseRateError):
         retry_after: Seconds to wait before retrying
     """
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self, message: str, details: str | None = None, retry_after: int | None = None
     ) -> None:
@@ -168,4 +174,4 @@ class NetworkError(WiseRateError):
         >>> raise NetworkError("Connection timeout", details="Could not reach API server")
     """
 
-    pass
+    __slots__ = ()
@@ -1,6 +1,11 @@
 """Exchange rate service for fetching and managing currency rates."""
 
 import asyncio
+import contextlib
+import importlib.util
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from decimal import Decimal
 from types import TracebackType
@@ -8,9 +13,9 @@ from typing import Any
 
 import httpx
 import structlog
-from pydantic import ValidationError
 
 from .config import Settings
+from .constants import CACHE_FLUSH_DELAY, CACHE_MAX_ENTRIES, MAX_CONCURRENT_REQUESTS
 from .exceptions import APIError, CacheError
 from .models import CurrencyPair, ExchangeRate
 from .utils import load_json_file_async, retry_with_backoff, save_json_file_async
@@ -18,33 +23,149 @@ from .utils import load_json_file_async, retry_with_backoff, save_json_file_asyn
 logger = structlog.get_logger(__name__)
 
 
-class RateLimiter:
-    """Token bucket rate limiter for API requests."""
+# HTTP/2 multiplexes concurrent requests over one connection; it needs the
+# optional h2 package (the "fast" extra), so fall back to HTTP/1.1 without it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+# Idle connections are kept for a minute so bursts of fetches reuse them
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=MAX_CONCURRENT_REQUESTS,
+    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+    keepalive_expiry=60.0,
+)
+_CLIENT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# One pooled client per event loop, shared by every service running on it.
+# Connections can't be reused across loops, so clients are never shared between them.
+_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+# Number of services using each loop's client; the last one to close it closes the client
+_client_users: dict[asyncio.AbstractEventLoop, int] = {}
+
+# HTTP statuses that mean the API wants us to slow down
+_CONGESTION_STATUS_CODES = frozenset({429, 503})
+
+
+def _loop_client() -> httpx.AsyncClient:
+    """Return the running loop's HTTP client, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        # Drop clients of loops that have since closed so they can be collected
+        for stale_loop in [other for other in _clients if other.is_closed()]:
+            del _clients[stale_loop]
+            _client_users.pop(stale_loop, None)
+        client = _clients[loop] = httpx.AsyncClient(
+            http2=_HTTP2, limits=_CLIENT_LIMITS, timeout=_CLIENT_TIMEOUT
+        )
+    return client
+
+
+def _retain_loop_client() -> asyncio.AbstractEventLoop:
+    """Register a service as a user of the running loop's HTTP client.
+
+    Returns:
+        The loop whose client the service now uses
+    """
+    loop = asyncio.get_running_loop()
+    _client_users[loop] = _client_users.get(loop, 0) + 1
+    return loop
+
+
+async def _release_loop_client(loop: asyncio.AbstractEventLoop) -> None:
+    """Drop a service's use of a loop's HTTP client, closing it after the last user.
 
-    def __init__(self, requests_per_minute: int):
+    The next _loop_client() call on that loop starts a new pool.
+    """
+    users = _client_users.pop(loop, 0) - 1
+    if users > 0:
+        _client_users[loop] = users
+        return
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def _log_refresh_failure(task: asyncio.Task[ExchangeRate]) -> None:
+    """Log a failed background refresh; nobody else awaits its result."""
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.warning("Background rate refresh failed", error=str(error))
+
+
+class RateLimiter:
+    """Adaptive token bucket rate limiter for API requests.
+
+    Tokens refill at ``rate`` per second, never faster than
+    ``requests_per_minute`` allows. The rate adapts to server feedback:
+    on_failure() cuts it and remembers where congestion started, and
+    on_success() grows it back, quickly while far from that point and
+    slowly near it.
+
+    Args:
+        requests_per_minute: Upper bound on the request rate and the bucket size
+        alpha: How strongly the distance to the congestion rate speeds up recovery
+        beta: Factor applied to the rate on failure
+        sigma: Lowest rate in requests per second
+        delta: Fixed rate increase per success, in requests per second
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        alpha: float = 0.1,
+        beta: float = 0.5,
+        sigma: float = 1 / 60,
+        delta: float = 0.05,
+    ):
         self.requests_per_minute = requests_per_minute
-        self.tokens = requests_per_minute
-        self.last_refill = datetime.now(UTC)
+        # Fractional so refills shorter than one token's interval aren't lost
+        self.tokens: float = requests_per_minute
+        # Monotonic seconds: cheap to read and unaffected by wall-clock changes
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
-    async def acquire(self) -> None:
-        """Acquire a token, waiting if necessary."""
-        async with self._lock:
-            now = datetime.now(UTC)
-
-            # Refill tokens based on time passed
-            time_passed = (now - self.last_refill).total_seconds()
-            tokens_to_add = int(time_passed * self.requests_per_minute / 60)
-            self.tokens = min(self.requests_per_minute, self.tokens + tokens_to_add)
-            self.last_refill = now
+        self.max_rate = requests_per_minute / 60
+        self.rate = self.max_rate
+        self.congestion_rate = self.max_rate
+        self.alpha = alpha
+        self.beta = beta
+        self.sigma = min(sigma, self.max_rate)
+        self.delta = delta
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill, up to the bucket size."""
+        now = time.monotonic()
+        time_passed = now - self.last_refill
+        self.tokens = min(self.requests_per_minute, self.tokens + time_passed * self.rate)
+        self.last_refill = now
+
+    def on_success(self) -> None:
+        """Raise the rate after a request the API accepted."""
+        if self.rate >= self.max_rate:
+            return
+        increase = self.delta + self.alpha * abs(self.rate - self.congestion_rate)
+        self.rate = min(self.max_rate, self.rate + increase)
+
+    def on_failure(self) -> None:
+        """Cut the rate and drain the bucket after the API signalled congestion."""
+        self.congestion_rate = self.rate
+        self.rate = max(self.sigma, self.beta * self.rate)
+        self.tokens = 0
+        logger.warning("Rate limited by API, slowing down", requests_per_second=self.rate)
 
-            if self.tokens <= 0:
-                # Calculate wait time for next token
-                wait_time = 60 / self.requests_per_minute
-                await asyncio.sleep(wait_time)
-                self.tokens += 1
+    async def acquire(self) -> None:
+        """Acquire a token, waiting if necessary.
 
-            self.tokens -= 1
+        The lock only guards the bucket arithmetic. Waiters sleep outside it and
+        re-check afterwards, so one sleeping caller doesn't hold up the others.
+        """
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                # Time until the missing fraction of a token has refilled
+                wait_time = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait_time)
 
 
 class ExchangeRateService:
@@ -52,15 +173,26 @@ class ExchangeRateService:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self._cache: dict[str, ExchangeRate] = {}
-        self._last_update: datetime | None = None
+        # In-memory rates in least-recently-used order, capped at CACHE_MAX_ENTRIES
+        self._cache: OrderedDict[str, ExchangeRate] = OrderedDict()
         self._rate_limiter = RateLimiter(settings.max_requests_per_minute)
-        # Create persistent AsyncClient with connection pooling
-        limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
-        timeout = httpx.Timeout(30.0, connect=10.0)
-        self._client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        # Explicit client override; by default each request uses the pooled
+        # client shared by all services on the running event loop
+        # (see _get_client())
+        self._client: httpx.AsyncClient | None = None
+        # Loop whose shared client this service has retained, released by close()
+        self._client_loop: asyncio.AbstractEventLoop | None = None
         # Request deduplication: track pending requests to avoid duplicate API calls
         self._pending_requests: dict[str, asyncio.Task[ExchangeRate]] = {}
+        self._pending_all: asyncio.Task[list[ExchangeRate]] | None = None
+        # Stale-while-revalidate refreshes nobody awaits; cancelled by close()
+        self._refresh_tasks: set[asyncio.Task[ExchangeRate]] = set()
+        # Raw API responses in flight, keyed by source currency
+        self._pending_sources: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        # Serialized rates not yet written to the persistent cache; see flush()
+        self._dirty_rates: dict[str, dict[str, str]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
 
     async def __aenter__(self) -> ExchangeRateService:
         """Async context manager entry."""
@@ -72,12 +204,33 @@ class ExchangeRateService:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Async context manager exit - close client."""
-        await self._client.aclose()
+        """Async context manager exit - flush the cache and close the client."""
+        await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Stop background refreshes, write pending cache entries and close the HTTP client."""
+        if self._refresh_tasks:
+            refreshes = list(self._refresh_tasks)
+            for task in refreshes:
+                task.cancel()
+            await asyncio.gather(*refreshes, return_exceptions=True)
+        # Already logged; closing must still release the client
+        with contextlib.suppress(CacheError):
+            await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        elif self._client_loop is not None:
+            loop, self._client_loop = self._client_loop, None
+            await _release_loop_client(loop)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client for the running event loop."""
+        if self._client is not None:
+            return self._client
+        if self._client_loop is None:
+            self._client_loop = _retain_loop_client()
+        return _loop_client()
 
     async def get_exchange_rate(
         self, currency_pair: CurrencyPair, update_cache: bool = False
@@ -86,34 +239,28 @@ class ExchangeRateService:
 
         Implements request deduplication: if multiple concurrent requests
         are made for the same currency pair, they share the same API call.
+        The shared call is shielded, so a caller that is cancelled doesn't
+        cancel it for the others.
+
+        Cached rates are served stale-while-revalidate: for up to
+        ``cache_stale_ttl`` seconds after they expire they are still returned
+        immediately while a background request refreshes them.
         """
-        cache_key = f"{currency_pair.source}_{currency_pair.target}"
+        cache_key = currency_pair.cache_key
 
         # Check cache first (unless update_cache is True)
-        if not update_cache and self._is_cache_valid(cache_key):
-            logger.info("Returning cached exchange rate", pair=cache_key)
-            return self._cache[cache_key]
-
-        # Check if there's already a pending request for this pair
-        if cache_key in self._pending_requests:
-            logger.debug("Deduplicating request", pair=cache_key)
-            try:
-                return await self._pending_requests[cache_key]
-            except Exception:
-                # If the pending request failed, remove it and continue
-                self._pending_requests.pop(cache_key, None)
-                raise
-
-        # Create new request task
-        request_task = asyncio.create_task(self._fetch_exchange_rate(currency_pair))
-        self._pending_requests[cache_key] = request_task
+        if not update_cache and (age := self._cache_age(cache_key)) is not None:
+            if age < self.settings.cache_ttl:
+                logger.info("Returning cached exchange rate", pair=cache_key)
+                return self._cache[cache_key]
+            if age < self.settings.cache_ttl + self.settings.cache_stale_ttl:
+                logger.info("Returning stale exchange rate while refreshing", pair=cache_key)
+                self._start_refresh(currency_pair, cache_key)
+                return self._cache[cache_key]
 
+        request_task = self._start_fetch(currency_pair, cache_key)
         try:
-            rate = await request_task
-            self._cache[cache_key] = rate
-            self._last_update = datetime.now(UTC)
-            await self._save_to_cache(rate)
-            return rate
+            return await asyncio.shield(request_task)
         except Exception as e:
             logger.error("Failed to fetch exchange rate", pair=cache_key, error=str(e))
             # Try to return cached data if available
@@ -121,19 +268,104 @@ class ExchangeRateService:
                 logger.warning("Returning stale cached data", pair=cache_key)
                 return self._cache[cache_key]
             raise
-        finally:
-            # Clean up pending request
-            self._pending_requests.pop(cache_key, None)
+
+    def _start_fetch(
+        self, currency_pair: CurrencyPair, cache_key: str
+    ) -> asyncio.Task[ExchangeRate]:
+        """Return the in-flight fetch for a pair, starting one if there is none.
+
+        Pending tasks are referenced from _pending_requests until they finish,
+        so background refreshes aren't garbage-collected mid-flight.
+        """
+        request_task = self._pending_requests.get(cache_key)
+        if request_task is not None:
+            logger.debug("Deduplicating request", pair=cache_key)
+            return request_task
+
+        request_task = asyncio.create_task(self._fetch_and_store(currency_pair))
+        self._pending_requests[cache_key] = request_task
+        # Cleaned up when the fetch ends, even if every caller was cancelled
+        request_task.add_done_callback(lambda _: self._pending_requests.pop(cache_key, None))
+        return request_task
+
+    def _start_refresh(self, currency_pair: CurrencyPair, cache_key: str) -> None:
+        """Refresh a stale rate in the background unless a fetch for it is already running."""
+        if cache_key in self._pending_requests:
+            return
+        refresh_task = self._start_fetch(currency_pair, cache_key)
+        self._refresh_tasks.add(refresh_task)
+        refresh_task.add_done_callback(self._refresh_tasks.discard)
+        refresh_task.add_done_callback(_log_refresh_failure)
+
+    async def _fetch_and_store(self, currency_pair: CurrencyPair) -> ExchangeRate:
+        """Fetch a rate and store it in the memory and disk caches."""
+        rate = await self._fetch_exchange_rate(currency_pair)
+        self._remember(rate)
+        self._save_to_cache(rate)
+        return rate
+
+    async def get_exchange_rates(
+        self, currency_pairs: Iterable[CurrencyPair]
+    ) -> list[ExchangeRate]:
+        """Fetch current rates for several currency pairs at once.
+
+        The API returns every target for a source currency in one response, so
+        pairs are grouped by source and each source is requested only once.
+
+        Args:
+            currency_pairs: Currency pairs to fetch
+
+        Returns:
+            Fetched exchange rates. Pairs whose source request failed or whose
+            target is missing from the response are omitted.
+        """
+        targets_by_source: dict[str, set[str]] = {}
+        for pair in currency_pairs:
+            targets_by_source.setdefault(pair.source, set()).add(pair.target)
+
+        sources = list(targets_by_source)
+        results = await asyncio.gather(
+            *(self._fetch_source_rates(source, targets_by_source[source]) for source in sources),
+            return_exceptions=True,
+        )
+
+        rates: list[ExchangeRate] = []
+        for source, result in zip(sources, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Failed to fetch exchange rates", source=source, error=str(result))
+                continue
+            rates.extend(result)
+
+        if rates:
+            for rate in rates:
+                self._remember(rate)
+            self._save_rates_to_cache(rates)
+
+        return rates
 
     async def get_all_rates(self) -> list[ExchangeRate]:
-        """Get all available exchange rates."""
+        """Get all available exchange rates.
+
+        Concurrent callers share one in-flight fetch. The shared fetch is
+        shielded, so a caller that is cancelled doesn't cancel it for the others.
+        """
+        if self._pending_all is None:
+            self._pending_all = asyncio.create_task(self._get_all_rates())
+            self._pending_all.add_done_callback(self._clear_pending_all)
+        return await asyncio.shield(self._pending_all)
+
+    def _clear_pending_all(self, task: asyncio.Task[list[ExchangeRate]]) -> None:
+        """Forget a finished get_all_rates() fetch so the next call starts a new one."""
+        if self._pending_all is task:
+            self._pending_all = None
+
+    async def _get_all_rates(self) -> list[ExchangeRate]:
+        """Fetch all rates, falling back to the persistent cache on failure."""
         try:
             rates = await self._fetch_all_rates()
             self._cache.clear()
             for rate in rates:
-                cache_key = f"{rate.source}_{rate.target}"
-                self._cache[cache_key] = rate
-            self._last_update = datetime.now(UTC)
+                self._remember(rate)
             await self._save_all_to_cache(rates)
             return rates
         except Exception as e:
@@ -143,49 +375,67 @@ class ExchangeRateService:
 
     async def _fetch_exchange_rate(self, currency_pair: CurrencyPair) -> ExchangeRate:
         """Fetch exchange rate from API."""
-        # Acquire rate limit token
-        await self._rate_limiter.acquire()
-
-        # Fetch from API
         return await self._fetch_from_api(currency_pair)
 
+    async def _fetch_source_rates(self, source: str, targets: set[str]) -> list[ExchangeRate]:
+        """Fetch rates for several targets of one source with a single API request."""
+        logger.info("Fetching exchange rates", source=source, targets=sorted(targets))
+        rates = await self._fetch_from_api_many(source, targets)
+        missing = targets.difference(rate.target for rate in rates)
+        if missing:
+            logger.warning(
+                "Rates not found in API response", source=source, targets=sorted(missing)
+            )
+        return rates
+
     async def _fetch_from_api(self, currency_pair: CurrencyPair) -> ExchangeRate:
         """Fetch exchange rate from API."""
         logger.info(
             "Fetching exchange rate", source=currency_pair.source, target=currency_pair.target
         )
 
-        async def _make_request() -> dict[str, Any]:
-            url = f"{self.settings.api_url}/latest/{currency_pair.source}"
-            response = await self._client.get(url)
-            response.raise_for_status()
-            return response.json()  # type: ignore[no-any-return]
+        rates = await self._fetch_from_api_many(currency_pair.source, {currency_pair.target})
+        if not rates:
+            raise APIError(f"Rate not found for {currency_pair.target}")
+        return rates[0]
+
+    async def _fetch_from_api_many(self, source: str, targets: set[str]) -> list[ExchangeRate]:
+        """Fetch exchange rates for the given targets from a single API response.
 
+        Targets missing from the response are logged and left out of the result.
+        """
         try:
-            data = await retry_with_backoff(_make_request)
+            data = await self._source_response(source)
             rates = data.get("rates", {})
-            target_rate = rates.get(currency_pair.target)
-
-            if target_rate is None:
-                logger.error(
-                    "Rate not found in API response",
-                    source=currency_pair.source,
-                    target=currency_pair.target,
-                    available_rates=list(rates.keys()),
+            timestamp = datetime.now(UTC)
+            result = []
+
+            for target in targets:
+                target_rate = rates.get(target)
+                if target_rate is None:
+                    logger.error(
+                        "Rate not found in API response",
+                        source=source,
+                        target=target,
+                        available_rates=list(rates.keys()),
+                    )
+                    continue
+
+                # JSON integers (e.g. 1 for the source itself) still need converting
+                rate_value = (
+                    target_rate if isinstance(target_rate, Decimal) else Decimal(str(target_rate))
                 )
-                raise APIError(f"Rate not found for {currency_pair.target}")
-
-            rate_value = Decimal(str(target_rate))
-            if rate_value <= 0:
-                logger.error("Invalid rate from API", rate=target_rate)
-                raise APIError(f"Invalid rate received from API: {rate_value}")
-
-            return ExchangeRate(
-                source=currency_pair.source,
-                target=currency_pair.target,
-                rate=rate_value,
-                timestamp=datetime.now(UTC),
-            )
+                if rate_value <= 0:
+                    logger.error("Invalid rate from API", rate=target_rate)
+                    raise APIError(f"Invalid rate received from API: {rate_value}")
+
+                result.append(
+                    ExchangeRate(source=source, target=target, rate=rate_value, timestamp=timestamp)
+                )
+
+            return result
+        except APIError:
+            raise
         except httpx.HTTPStatusError as e:
             logger.error(
                 "API HTTP error",
@@ -217,55 +467,142 @@ class ExchangeRateService:
             logger.error("Unexpected API error", error=str(e), error_type=type(e).__name__)
             raise APIError(f"Unexpected error fetching from API: {e}")
 
+    def _source_response(self, source: str) -> asyncio.Future[dict[str, Any]]:
+        """Return the in-flight API response for a source, requesting it if needed.
+
+        Each source currency is its own endpoint and its response covers every
+        target, so concurrent fetches for pairs with the same source share one
+        request and one rate limit token. Requests for different sources run
+        independently.
+        """
+        request_task = self._pending_sources.get(source)
+        if request_task is None:
+            request_task = asyncio.create_task(self._request_source(source))
+            self._pending_sources[source] = request_task
+            request_task.add_done_callback(lambda _: self._pending_sources.pop(source, None))
+        return asyncio.shield(request_task)
+
+    async def _request_source(self, source: str) -> dict[str, Any]:
+        """Request the latest rates for a source currency, with rate limiting and retries."""
+        await self._rate_limiter.acquire()
+
+        async def _make_request() -> dict[str, Any]:
+            url = f"{self.settings.api_url}/latest/{source}"
+            response = await self._get_client().get(url)
+            if response.status_code in _CONGESTION_STATUS_CODES:
+                self._rate_limiter.on_failure()
+            elif response.is_success:
+                self._rate_limiter.on_success()
+            response.raise_for_status()
+            # Decode rates straight to Decimal instead of going through float and str
+            data: dict[str, Any] = response.json(parse_float=Decimal)
+            return data
+
+        return await retry_with_backoff(_make_request)
+
     async def _fetch_all_rates(self) -> list[ExchangeRate]:
         """Fetch all available exchange rates."""
         # This would need to be implemented based on the specific API
         # For now, return empty list
         return []
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid."""
-        if cache_key not in self._cache:
-            return False
+    def _cache_age(self, cache_key: str) -> float | None:
+        """Return the age of a cached rate in seconds, or None if it isn't cached.
 
-        if not self._last_update:
-            return False
+        Each rate is aged from its own timestamp, so refreshing one pair
+        doesn't make the others look fresh.
+        """
+        rate = self._cache.get(cache_key)
+        if rate is None:
+            return None
+
+        # Every read goes through here, so this is where an entry counts as used
+        self._cache.move_to_end(cache_key)
+        return (datetime.now(UTC) - rate.timestamp).total_seconds()
+
+    def _remember(self, rate: ExchangeRate) -> None:
+        """Store a rate in the memory cache, evicting the least recently used past the cap."""
+        cache = self._cache
+        cache[rate.cache_key] = rate
+        cache.move_to_end(rate.cache_key)
+        if len(cache) > CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
 
-        cache_age = datetime.now(UTC) - self._last_update
-        return cache_age.total_seconds() < self.settings.cache_ttl
+    def _is_cache_valid(self, cache_key: str) -> bool:
+        """Check if cached data is still valid."""
+        age = self._cache_age(cache_key)
+        return age is not None and age < self.settings.cache_ttl
 
-    async def _save_to_cache(self, rate: ExchangeRate) -> None:
-        """Save exchange rate to persistent cache.
+    def _save_to_cache(self, rate: ExchangeRate) -> None:
+        """Queue an exchange rate for the persistent cache.
 
         Args:
             rate: Exchange rate to save to cache
+        """
+        self._save_rates_to_cache([rate])
 
-        Raises:
-            CacheError: If cache save operation fails
+    def _save_rates_to_cache(self, rates: list[ExchangeRate]) -> None:
+        """Queue exchange rates for the persistent cache.
+
+        Rates are buffered and written together by a flush scheduled
+        CACHE_FLUSH_DELAY seconds after the first unsaved rate, so a burst of
+        fetches costs one read and one write of the cache file.
+
+        Args:
+            rates: Exchange rates to save to cache
         """
-        try:
-            cache_data = await load_json_file_async(self.settings.currencies_file)
-            cache_key = f"{rate.source}_{rate.target}"
-            cache_data[cache_key] = {
+        for rate in rates:
+            self._dirty_rates[rate.cache_key] = {
                 "source": rate.source,
                 "target": rate.target,
                 "rate": str(rate.rate),
                 "timestamp": rate.timestamp.isoformat(),
             }
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
 
-            await save_json_file_async(self.settings.currencies_file, cache_data)
-            logger.debug("Saved rate to cache", pair=cache_key)
-        except Exception as e:
-            logger.error("Failed to save to cache", error=str(e))
-            raise CacheError(f"Failed to save rate to cache: {e}")
+    async def _flush_later(self) -> None:
+        """Flush the cache once the coalescing window has passed."""
+        await asyncio.sleep(CACHE_FLUSH_DELAY)
+        # Cleared first so rates queued during the write schedule a new flush
+        self._flush_task = None
+        # Already logged; the rates stay queued for the next flush
+        with contextlib.suppress(CacheError):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Merge queued rates into the persistent cache with a single write.
+
+        Raises:
+            CacheError: If cache save operation fails
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        # Serialized so a flush on close waits for one already writing
+        async with self._flush_lock:
+            if not self._dirty_rates:
+                return
+            pending, self._dirty_rates = self._dirty_rates, {}
+            try:
+                cache_data = await load_json_file_async(self.settings.currencies_file)
+                cache_data.update(pending)
+                await save_json_file_async(self.settings.currencies_file, cache_data)
+                logger.debug("Saved rates to cache", count=len(pending))
+            except Exception as e:
+                # Keep the rates queued unless newer ones replaced them meanwhile
+                for cache_key, entry in pending.items():
+                    self._dirty_rates.setdefault(cache_key, entry)
+                logger.error("Failed to save to cache", error=str(e))
+                raise CacheError(f"Failed to save rates to cache: {e}")
 
     async def _save_all_to_cache(self, rates: list[ExchangeRate]) -> None:
         """Save all exchange rates to persistent cache."""
         try:
             cache_data = {}
             for rate in rates:
-                cache_key = f"{rate.source}_{rate.target}"
-                cache_data[cache_key] = {
+                cache_data[rate.cache_key] = {
                     "source": rate.source,
                     "target": rate.target,
                     "rate": str(rate.rate),
@@ -277,25 +614,54 @@ class ExchangeRateService:
             logger.error("Failed to save all rates to cache", error=str(e))
             raise CacheError(f"Failed to save all rates to cache: {e}")
 
-    async def _load_from_cache(self) -> list[ExchangeRate]:
-        """Load exchange rates from persistent cache."""
-        try:
-            cache_data = await load_json_file_async(self.settings.currencies_file)
-            rates = []
+    @staticmethod
+    def _parse_cache_entries(cache_data: dict[str, Any]) -> list[ExchangeRate]:
+        """Rebuild exchange rates from persistent cache entries.
 
-            for key, data in cache_data.items():
-                try:
-                    rate = ExchangeRate(
+        The file only holds rates this service validated before saving, so
+        entries are rebuilt with model_construct() instead of a full pydantic
+        validation each. Malformed entries are logged and skipped.
+        """
+        rates: list[ExchangeRate] = []
+        # Bound once; looked up for every entry otherwise
+        append = rates.append
+        construct = ExchangeRate.model_construct
+        parse_timestamp = datetime.fromisoformat
+        # Rates saved in one batch share a timestamp; parse each string once
+        timestamps: dict[str, datetime] = {}
+
+        for key, data in cache_data.items():
+            try:
+                stamp = data["timestamp"]
+                timestamp = timestamps.get(stamp)
+                if timestamp is None:
+                    timestamp = timestamps[stamp] = parse_timestamp(stamp)
+                rate_value = Decimal(data["rate"])
+                if not rate_value > 0:
+                    raise ValueError(f"Exchange rate must be positive, got {rate_value}")
+                append(
+                    construct(
                         source=data["source"],
                         target=data["target"],
-                        rate=Decimal(data["rate"]),
-                        timestamp=datetime.fromisoformat(data["timestamp"]),
+                        rate=rate_value,
+                        timestamp=timestamp,
                     )
-                    rates.append(rate)
-                except (ValidationError, KeyError, ValueError) as e:
-                    logger.warning("Invalid cache entry", key=key, error=str(e))
+                )
+            except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+                # ArithmeticError covers decimal.InvalidOperation for malformed rates
+                logger.warning("Invalid cache entry", key=key, error=str(e))
 
-            return rates
+        return rates
+
+    async def _load_from_cache(self) -> list[ExchangeRate]:
+        """Load exchange rates from persistent cache.
+
+        Entries are parsed in a worker thread so a large cache file doesn't
+        block the event loop.
+        """
+        try:
+            cache_data = await load_json_file_async(self.settings.currencies_file)
+            return await asyncio.to_thread(self._parse_cache_entries, cache_data)
         except Exception as e:
             logger.error("Failed to load from cache", error=str(e))
             raise CacheError(f"Failed to load rates from cache: {e}")
@@ -6,11 +6,13 @@ This module defines the core data structures used throughout WiseRate:
 - Alert: Represents price alerts for exchange rates
 """
 
+import sys
 from datetime import UTC, datetime
 from decimal import Decimal
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .utils import validate_currency_code
 
@@ -31,6 +33,8 @@ class CurrencyPair(BaseModel):
         'USD/EUR'
     """
 
+    model_config = ConfigDict(frozen=True)
+
     source: str = Field(..., min_length=3, max_length=3, description="Source currency code")
     target: str = Field(..., min_length=3, max_length=3, description="Target currency code")
 
@@ -81,6 +85,18 @@ class CurrencyPair(BaseModel):
         """
         return f"{self.source}/{self.target}"
 
+    @cached_property
+    def cache_key(self) -> str:
+        """Key identifying this pair in rate caches and alert storage.
+
+        Built once per instance and interned, so repeated dict lookups with
+        the same pair mostly compare by identity.
+
+        Returns:
+            String in format 'SOURCE_TARGET'
+        """
+        return sys.intern(f"{self.source}_{self.target}")
+
 
 class ExchangeRate(BaseModel):
     """Represents an exchange rate between two currencies.
@@ -102,6 +118,8 @@ class ExchangeRate(BaseModel):
         '1 USD = 0.85 EUR'
     """
 
+    model_config = ConfigDict(frozen=True)
+
     source: str = Field(..., min_length=3, max_length=3)
     target: str = Field(..., min_length=3, max_length=3)
     rate: Decimal = Field(..., ge=0, description="Exchange rate")
@@ -135,6 +153,15 @@ class ExchangeRate(BaseModel):
         """
         return f"1 {self.source} = {self.rate} {self.target}"
 
+    @cached_property
+    def cache_key(self) -> str:
+        """Key of this rate's currency pair; matches CurrencyPair.cache_key.
+
+        Returns:
+            String in format 'SOURCE_TARGET'
+        """
+        return sys.intern(f"{self.source}_{self.target}")
+
     def format_rate(self, precision: int = 6) -> str:
         """Format the exchange rate with specified decimal precision.
 
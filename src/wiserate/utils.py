@@ -2,12 +2,22 @@
 
 import asyncio
 import json
+import os
+import tempfile
+from collections.abc import Awaitable, Callable
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import aiofiles
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+from .constants import CURRENCY_PRECISION_GET
+
 # Common currency codes (ISO 4217)
 COMMON_CURRENCIES = {
     "USD",
@@ -107,6 +117,51 @@ EXTENDED_CURRENCIES = COMMON_CURRENCIES | {
 }
 
 
+# Display names for the common currencies
+CURRENCY_NAMES = {
+    "USD": "US Dollar",
+    "EUR": "Euro",
+    "GBP": "British Pound",
+    "JPY": "Japanese Yen",
+    "AUD": "Australian Dollar",
+    "CAD": "Canadian Dollar",
+    "CHF": "Swiss Franc",
+    "CNY": "Chinese Yuan",
+    "SEK": "Swedish Krona",
+    "NZD": "New Zealand Dollar",
+    "MXN": "Mexican Peso",
+    "SGD": "Singapore Dollar",
+    "HKD": "Hong Kong Dollar",
+    "NOK": "Norwegian Krone",
+    "KRW": "South Korean Won",
+    "TRY": "Turkish Lira",
+    "RUB": "Russian Ruble",
+    "INR": "Indian Rupee",
+    "BRL": "Brazilian Real",
+    "ZAR": "South African Rand",
+    "PLN": "Polish Złoty",
+    "THB": "Thai Baht",
+    "IDR": "Indonesian Rupiah",
+    "HUF": "Hungarian Forint",
+    "CZK": "Czech Koruna",
+    "ILS": "Israeli Shekel",
+    "CLP": "Chilean Peso",
+    "PHP": "Philippine Peso",
+    "AED": "UAE Dirham",
+    "COP": "Colombian Peso",
+    "SAR": "Saudi Riyal",
+    "MYR": "Malaysian Ringgit",
+    "RON": "Romanian Leu",
+    "BGN": "Bulgarian Lev",
+    "HRK": "Croatian Kuna",
+    "DKK": "Danish Krone",
+    "ISK": "Icelandic Króna",
+    "BAM": "Bosnia-Herzegovina Convertible Mark",
+    "ALL": "Albanian Lek",
+    "MKD": "Macedonian Denar",
+}
+
+
 @lru_cache(maxsize=512)
 def validate_currency_code(currency: str) -> bool:
     """Validate if a currency code is valid.
@@ -122,65 +177,66 @@ def validate_currency_code(currency: str) -> bool:
     return currency.upper() in EXTENDED_CURRENCIES
 
 
-@lru_cache(maxsize=256)
+@lru_cache(maxsize=512)
 def get_currency_name(currency: str) -> str | None:
     """Get currency name from code."""
-    currency_names = {
-        "USD": "US Dollar",
-        "EUR": "Euro",
-        "GBP": "British Pound",
-        "JPY": "Japanese Yen",
-        "AUD": "Australian Dollar",
-        "CAD": "Canadian Dollar",
-        "CHF": "Swiss Franc",
-        "CNY": "Chinese Yuan",
-        "SEK": "Swedish Krona",
-        "NZD": "New Zealand Dollar",
-        "MXN": "Mexican Peso",
-        "SGD": "Singapore Dollar",
-        "HKD": "Hong Kong Dollar",
-        "NOK": "Norwegian Krone",
-        "KRW": "South Korean Won",
-        "TRY": "Turkish Lira",
-        "RUB": "Russian Ruble",
-        "INR": "Indian Rupee",
-        "BRL": "Brazilian Real",
-        "ZAR": "South African Rand",
-        "PLN": "Polish Złoty",
-        "THB": "Thai Baht",
-        "IDR": "Indonesian Rupiah",
-        "HUF": "Hungarian Forint",
-        "CZK": "Czech Koruna",
-        "ILS": "Israeli Shekel",
-        "CLP": "Chilean Peso",
-        "PHP": "Philippine Peso",
-        "AED": "UAE Dirham",
-        "COP": "Colombian Peso",
-        "SAR": "Saudi Riyal",
-        "MYR": "Malaysian Ringgit",
-        "RON": "Romanian Leu",
-        "BGN": "Bulgarian Lev",
-        "HRK": "Croatian Kuna",
-        "DKK": "Danish Krone",
-        "ISK": "Icelandic Króna",
-        "BAM": "Bosnia-Herzegovina Convertible Mark",
-        "ALL": "Albanian Lek",
-        "MKD": "Macedonian Denar",
-    }
-    return currency_names.get(currency.upper())
+    return CURRENCY_NAMES.get(currency.upper())
 
 
 def format_currency_amount(amount: float, currency: str, precision: int = 2) -> str:
     """Format currency amount with proper precision."""
-    if currency in ["JPY", "KRW", "IDR", "VND", "BYN"]:
-        # No decimal places for these currencies
-        return f"{int(amount)} {currency}"
-    elif currency in ["BHD", "IQD", "JOD", "KWD", "LYD", "OMR", "TND"]:
-        # 3 decimal places for these currencies
-        return f"{amount:.3f} {currency}"
-    else:
-        # Standard 2 decimal places
+    # One dict lookup instead of scanning the per-precision currency lists
+    digits = CURRENCY_PRECISION_GET(currency)
+    if digits is None:
+        # Standard 2 decimal places unless the caller asks otherwise
         return f"{amount:.{precision}f} {currency}"
+    if digits == 0:
+        # No decimal places; the amount is truncated, not rounded
+        return f"{int(amount)} {currency}"
+    return f"{amount:.{digits}f} {currency}"
+
+
+def json_dumps(data: Any, indent: bool = False) -> str:
+    """Serialize data to a JSON string, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+        indent: If True, pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as a string (non-ASCII characters are kept as-is)
+
+    Raises:
+        TypeError: If data is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+
+
+def _json_file_bytes(data: Any) -> bytes:
+    """Serialize data for a JSON file as indented UTF-8 bytes.
+
+    orjson produces bytes natively, so files are written without an
+    intermediate str. Non-string keys are stringified as the json module does.
+
+    Raises:
+        TypeError: If data is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def ensure_directory(path: Path) -> None:
@@ -188,18 +244,20 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-async def retry_with_backoff(func: Any, max_retries: int = 3, base_delay: float = 1.0) -> Any:
+async def retry_with_backoff[T](
+    func: Callable[[], Awaitable[T]], max_retries: int = 3, base_delay: float = 1.0
+) -> T:
     """Retry function with exponential backoff."""
-    for attempt in range(max_retries):
+    for attempt in range(max_retries - 1):
         try:
             return await func()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                raise e
-
+        except Exception:
             delay = base_delay * (2**attempt)
             await asyncio.sleep(delay)
 
+    # Last attempt: its exception propagates to the caller
+    return await func()
+
 
 async def load_json_file_async(
     file_path: Path, default: dict[str, Any] | None = None
@@ -227,9 +285,10 @@ async def load_json_file_async(
             if file_size > max_size:
                 raise ValueError(f"File too large: {file_size} bytes (max: {max_size})")
 
-            async with aiofiles.open(file_path, encoding="utf-8") as f:
+            # Parsed from bytes; both orjson and json decode UTF-8 themselves
+            async with aiofiles.open(file_path, "rb") as f:
                 content = await f.read()
-                data = json.loads(content)
+                data = json_loads(content)
 
                 # Validate that result is a dictionary
                 if not isinstance(data, dict):
@@ -270,14 +329,14 @@ def load_json_file(file_path: Path, default: dict[str, Any] | None = None) -> di
             if file_size > max_size:
                 raise ValueError(f"File too large: {file_size} bytes (max: {max_size})")
 
-            with file_path.open(encoding="utf-8") as f:
-                data = json.load(f)
+            # Read in one shot and parse the bytes directly
+            data = json_loads(file_path.read_bytes())
 
-                # Validate that result is a dictionary
-                if not isinstance(data, dict):
-                    raise ValueError(f"Expected dict, got {type(data).__name__}")
+            # Validate that result is a dictionary
+            if not isinstance(data, dict):
+                raise ValueError(f"Expected dict, got {type(data).__name__}")
 
-                return data
+            return data
     except (json.JSONDecodeError, OSError, ValueError) as e:
         # Log but don't crash - return default
         import structlog
@@ -288,6 +347,30 @@ def load_json_file(file_path: Path, default: dict[str, Any] | None = None) -> di
     return default
 
 
+def _write_atomic(file_path: Path, content: bytes) -> None:
+    """Replace a file's content atomically.
+
+    The content is written to a uniquely named temp file in the same directory,
+    then renamed over the target, so readers never see a partial file and
+    concurrent writers never share a temp file.
+
+    Raises:
+        OSError: If the write or rename fails
+    """
+    fd, temp_name = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    temp_file = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        temp_file.replace(file_path)
+    except BaseException:
+        # Clean up temp file if it still exists
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
 async def save_json_file_async(file_path: Path, data: dict[str, Any]) -> None:
     """Save JSON file asynchronously with error handling and atomic writes.
 
@@ -307,28 +390,14 @@ async def save_json_file_async(file_path: Path, data: dict[str, Any]) -> None:
     try:
         ensure_directory(file_path.parent)
 
-        # Validate data is serializable before writing
+        # Serialize once up front so unserializable data never touches the disk
         try:
-            json.dumps(data)
+            content = _json_file_bytes(data)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Data is not JSON serializable: {e}")
 
-        # Atomic write: write to temp file first, then rename
-        temp_file = file_path.with_suffix(file_path.suffix + ".tmp")
-
-        try:
-            async with aiofiles.open(temp_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(data, indent=2, ensure_ascii=False))
-
-            # Atomic rename
-            import shutil
-
-            shutil.move(str(temp_file), str(file_path))
-        except Exception:
-            # Clean up temp file if it still exists
-            if temp_file.exists():
-                temp_file.unlink()
-            raise
+        # One thread hop for the whole write rather than one per file operation
+        await asyncio.to_thread(_write_atomic, file_path, content)
 
     except OSError as e:
         raise OSError(f"Failed to save {file_path}: {e}")
@@ -353,27 +422,13 @@ def save_json_file(file_path: Path, data: dict[str, Any]) -> None:
     try:
         ensure_directory(file_path.parent)
 
-        # Validate data is serializable before writing
+        # Serialize once up front so unserializable data never touches the disk
         try:
-            json.dumps(data)
+            content = _json_file_bytes(data)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Data is not JSON serializable: {e}")
 
-        # Atomic write: write to temp file first, then rename
-        temp_file = file_path.with_suffix(file_path.suffix + ".tmp")
-
-        try:
-            with temp_file.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                # Ensure data is flushed to disk
-                f.flush()
-
-            # Atomic rename
-            temp_file.replace(file_path)
-        finally:
-            # Clean up temp file if it still exists
-            if temp_file.exists():
-                temp_file.unlink()
+        _write_atomic(file_path, content)
 
     except OSError as e:
         raise OSError(f"Failed to save {file_path}: {e}")
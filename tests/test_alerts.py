@@ -1,10 +1,12 @@
 """Tests for the alert service."""
 
+import json
 from decimal import Decimal
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from wiserate.alerts import AlertService
+from wiserate.alerts import AlertService, _flush_all_at_exit
 from wiserate.config import Settings
 from wiserate.models import CurrencyPair, ExchangeRate
 
@@ -181,3 +183,117 @@ class TestAlertService:
         key = service._get_alert_key(pair)
 
         assert key == "USD_EUR"
+
+    def test_disabled_state_persisted(self, settings):
+        """Test that enable/disable changes are written to the alerts file."""
+        service1 = AlertService(settings)
+        pair = CurrencyPair(source="USD", target="EUR")
+        service1.add_alert(pair, Decimal("0.90"))
+        service1.disable_alert(pair)
+
+        service2 = AlertService(settings)
+        assert service2.get_alert(pair).enabled is False
+        # Atomic writes must not leave temp files behind
+        assert list(settings.data_dir.glob("*.tmp")) == []
+
+    @pytest.mark.asyncio
+    async def test_flush_coalesces_writes_in_async_context(self, settings):
+        """Test that async-context mutations are written once on flush."""
+        service = AlertService(settings)
+        service.add_alert(CurrencyPair(source="USD", target="EUR"), Decimal("0.90"))
+        service.add_alert(CurrencyPair(source="GBP", target="USD"), Decimal("1.25"))
+
+        assert not settings.alerts_file.exists()
+
+        await service.flush()
+
+        data = json.loads(settings.alerts_file.read_text())
+        assert set(data) == {"USD_EUR", "GBP_USD"}
+
+    @pytest.mark.asyncio
+    async def test_flush_retries_after_failed_write(self, settings):
+        """Test that a failed write leaves changes pending for the next flush."""
+        service = AlertService(settings)
+        service.add_alert(CurrencyPair(source="USD", target="EUR"), Decimal("0.90"))
+
+        with patch(
+            "wiserate.alerts.save_json_file_async", new_callable=AsyncMock, side_effect=OSError
+        ):
+            await service.flush()
+
+        assert service._unsaved_changes
+        await service.flush()
+
+        assert not service._unsaved_changes
+        assert set(json.loads(settings.alerts_file.read_text())) == {"USD_EUR"}
+
+    @pytest.mark.asyncio
+    async def test_changes_during_write_stay_pending(self, settings):
+        """Test that a change made while a write is in flight is not marked saved."""
+        service = AlertService(settings)
+        service.add_alert(CurrencyPair(source="USD", target="EUR"), Decimal("0.90"))
+
+        async def save_and_mutate(file_path, data):
+            service.add_alert(CurrencyPair(source="GBP", target="USD"), Decimal("1.25"))
+
+        with patch("wiserate.alerts.save_json_file_async", side_effect=save_and_mutate):
+            await service.flush()
+
+        assert service._unsaved_changes == 1
+
+    def test_sync_mutation_uses_sync_writer(self, settings):
+        """Test that changes outside an event loop are written without starting one."""
+        service = AlertService(settings)
+
+        with (
+            patch("wiserate.alerts.asyncio.run") as mock_run,
+            patch("wiserate.alerts.save_json_file_async") as mock_save_async,
+        ):
+            service.add_alert(CurrencyPair(source="USD", target="EUR"), Decimal("0.90"))
+
+        mock_run.assert_not_called()
+        mock_save_async.assert_not_called()
+        assert not service._unsaved_changes
+        assert set(json.loads(settings.alerts_file.read_text())) == {"USD_EUR"}
+
+    @pytest.mark.asyncio
+    async def test_exit_hook_flushes_pending_changes(self, settings):
+        """Test that the shared exit hook writes changes that were never flushed."""
+        service = AlertService(settings)
+        service.add_alert(CurrencyPair(source="USD", target="EUR"), Decimal("0.90"))
+
+        _flush_all_at_exit()
+
+        assert not service._unsaved_changes
+        assert set(json.loads(settings.alerts_file.read_text())) == {"USD_EUR"}
+
+    @pytest.mark.asyncio
+    async def test_alerts_loaded_immediately_in_async_context(self, settings):
+        """Test that a service created inside an event loop sees saved alerts."""
+        service = AlertService(settings)
+        service.add_alert(CurrencyPair(source="USD", target="EUR"), Decimal("0.90"))
+        await service.flush()
+
+        reloaded = AlertService(settings)
+
+        assert reloaded.get_alert(CurrencyPair(source="USD", target="EUR")) is not None
+
+    def test_check_alerts_batch(self, service):
+        """Test checking many rates at once triggers only matching alerts."""
+        service.add_alert(CurrencyPair(source="USD", target="EUR"), Decimal("0.90"))
+        service.add_alert(CurrencyPair(source="GBP", target="USD"), Decimal("1.25"))
+
+        rates = [
+            ExchangeRate(source="USD", target="EUR", rate=Decimal("0.95")),
+            ExchangeRate(source="GBP", target="USD", rate=Decimal("1.20")),
+            ExchangeRate(source="USD", target="JPY", rate=Decimal("150")),
+        ]
+
+        triggered = service.check_alerts_batch(rates)
+
+        assert [alert.currency_pair.target for alert in triggered] == ["EUR"]
+        assert triggered[0].last_triggered is not None
+        assert service._serialized["USD_EUR"]["last_triggered"] == (
+            triggered[0].last_triggered.isoformat()
+        )
+        assert service._serialized["GBP_USD"]["last_triggered"] is None
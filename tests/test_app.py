@@ -198,3 +198,85 @@ class TestWiseRateApp:
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await task
+
+    @pytest.mark.asyncio
+    async def test_monitoring_loop_sleeps_until_next_deadline(self, app):
+        """Test that time spent checking is subtracted from the next sleep."""
+        import asyncio
+
+        clock = [0.0]
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+            if len(sleeps) == 3:
+                raise asyncio.CancelledError
+
+        async def slow_check(batch_size):
+            clock[0] += 0.25
+
+        with (
+            patch.object(asyncio.get_running_loop(), "time", side_effect=lambda: clock[0]),
+            patch.object(app, "check_alerts_once", side_effect=slow_check),
+            patch("wiserate.app.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            await app.run_monitoring_loop(interval=1)
+
+        assert sleeps == [0.75, 0.75, 0.75]
+
+    @pytest.mark.asyncio
+    async def test_monitoring_loop_failure_does_not_cancel_other_pairs(self, app):
+        """Test that one failing pair does not stop the others from being checked."""
+        import asyncio
+
+        await app.set_alert("USD", "EUR", Decimal("0.90"))
+        await app.set_alert("GBP", "USD", Decimal("1.25"))
+
+        checked = []
+
+        async def fake_get_rate(source, target, update_cache=False):
+            checked.append((source, target))
+            if source == "USD":
+                raise Exception("API Error")
+            await asyncio.sleep(0)
+            return ExchangeRate(source=source, target=target, rate=Decimal("1.30"))
+
+        with (
+            patch.object(app.exchange_service, "get_exchange_rates", return_value=[]),
+            patch.object(app, "get_exchange_rate", side_effect=fake_get_rate),
+        ):
+            task = asyncio.create_task(app.run_monitoring_loop(interval=60))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        assert sorted(checked) == [("GBP", "USD"), ("USD", "EUR")]
+
+    @pytest.mark.asyncio
+    async def test_monitoring_loop_uses_bulk_fetch(self, app):
+        """Test that the monitoring loop checks alerts from one bulk fetch."""
+        import asyncio
+
+        await app.set_alert("USD", "EUR", Decimal("0.80"))
+        await app.set_alert("USD", "GBP", Decimal("0.70"))
+
+        rates = [
+            ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85")),
+            ExchangeRate(source="USD", target="GBP", rate=Decimal("0.73")),
+        ]
+
+        with (
+            patch.object(app.exchange_service, "get_exchange_rates", return_value=rates) as bulk,
+            patch.object(app, "get_exchange_rate") as single,
+        ):
+            task = asyncio.create_task(app.run_monitoring_loop(interval=60))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        bulk.assert_called_once()
+        single.assert_not_called()
+        assert all(alert.last_triggered for alert in app.alert_service.get_all_alerts())
@@ -1,9 +1,29 @@
 """Tests for CLI functionality."""
 
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
+import structlog
 from click.testing import CliRunner
 
-from wiserate.cli import cli
+import wiserate.cli
+from wiserate.cli import (
+    _config_table,
+    _currencies_table,
+    _partition_flags,
+    cli,
+    execute_interactive_command,
+    setup_logging,
+)
+from wiserate.config import Settings, _load_settings
+from wiserate.models import Alert, CurrencyPair, ExchangeRate
 
 
 class TestCLI:
@@ -21,18 +41,210 @@ class TestCLI:
         assert "WiseRate" in result.output
         assert "Modern CLI tool" in result.output
 
+    def test_cli_help_skips_heavy_imports(self):
+        """Test that --help doesn't import the app, asyncio, rich or structlog."""
+        code = (
+            "import sys\n"
+            "from wiserate.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "heavy = {'asyncio', 'httpx', 'pydantic', 'rich', 'structlog', 'wiserate.utils'}\n"
+            "print(sorted(heavy & set(sys.modules)))\n"
+        )
+        src_path = Path(__file__).parent.parent / "src"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src_path)},
+        )
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
     def test_config_command(self, runner):
         """Test config command."""
         result = runner.invoke(cli, ["config"])
         assert result.exit_code == 0
         assert "Configuration" in result.output
 
+    def test_config_does_not_create_data_dir(self, runner, tmp_path):
+        """Test that displaying settings leaves the filesystem alone."""
+        data_dir = tmp_path / "wiserate"
+        result = runner.invoke(cli, ["config"], env={"WISERATE_DATA_DIR": str(data_dir)})
+
+        assert result.exit_code == 0
+        assert not data_dir.exists()
+
+    def test_settings_loaded_once(self, runner, monkeypatch):
+        """Test that repeated invocations reuse the loaded settings."""
+        monkeypatch.setenv("WISERATE_LOG_LEVEL", "INFO")
+        _load_settings.cache_clear()
+
+        with patch("wiserate.config.Settings", wraps=Settings) as mock_settings:
+            assert runner.invoke(cli, ["config"]).exit_code == 0
+            assert runner.invoke(cli, ["config"]).exit_code == 0
+
+        mock_settings.assert_called_once()
+
+    def test_monitor_rejects_invalid_batch_size(self, runner):
+        """Test that monitor requires a positive batch size."""
+        result = runner.invoke(cli, ["monitor", "--batch-size", "0"])
+        assert result.exit_code == 2
+        assert "--batch-size" in result.output
+
+    def test_export_csv(self, runner):
+        """Test CSV export is built from structured alerts."""
+        alert = Alert(
+            currency_pair=CurrencyPair(source="EUR", target="USD"),
+            threshold=Decimal("1.05"),
+            is_above=False,
+        )
+
+        with patch("wiserate.app.WiseRateApp.get_alerts", return_value=[alert]):
+            result = runner.invoke(cli, ["export", "--format", "csv"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "type,source,target,threshold,is_above,enabled,created_at"
+        assert lines[1] == f"alert,EUR,USD,1.05,False,True,{alert.created_at.isoformat()}"
+
+    def test_history_csv_and_json(self, runner):
+        """Test machine-readable history output is written without rich markup."""
+        rate = ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85"))
+
+        with patch("wiserate.app.WiseRateApp.get_exchange_rate", return_value=rate):
+            csv_result = runner.invoke(cli, ["history", "usd", "eur", "--format", "csv"])
+            json_result = runner.invoke(cli, ["history", "usd", "eur", "--format", "json"])
+
+        assert csv_result.stdout == f"USD,EUR,0.85,{rate.timestamp.isoformat()}\n"
+        assert json.loads(json_result.stdout)["rate"] == "0.85"
+
+    def test_export_json(self, runner):
+        """Test JSON export is valid JSON with the alerts in it."""
+        alert = Alert(
+            currency_pair=CurrencyPair(source="EUR", target="USD"),
+            threshold=Decimal("1.05"),
+            is_above=False,
+        )
+
+        with patch("wiserate.app.WiseRateApp.get_alerts", return_value=[alert]):
+            result = runner.invoke(cli, ["export", "--format", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["alerts"] == [alert.model_dump(mode="json")]
+
+    @pytest.fixture
+    def unconfigured_logging(self):
+        """Start without logging configured and restore structlog's defaults after."""
+        wiserate.cli._CONFIGURED_LEVEL = None
+        yield
+        structlog.reset_defaults()
+        wiserate.cli._CONFIGURED_LEVEL = None
+
+    @pytest.mark.usefixtures("unconfigured_logging")
+    def test_setup_logging_filters_and_writes_json_to_stderr(self, capsys):
+        """Test that logs below the level are dropped and the rest go to stderr."""
+        setup_logging("warning")
+        logger = structlog.get_logger("test")
+        logger.info("hidden")
+        logger.warning("shown", pair="USD/EUR")
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        [line] = captured.err.splitlines()
+        assert json.loads(line) | {"timestamp": None} == {
+            "event": "shown",
+            "level": "warning",
+            "pair": "USD/EUR",
+            "timestamp": None,
+        }
+
+    @pytest.mark.usefixtures("unconfigured_logging")
+    def test_setup_logging_skips_same_level(self):
+        """Test that structlog is only reconfigured when the level changes."""
+        with patch("structlog.configure") as mock_configure:
+            setup_logging("INFO")
+            setup_logging("info")
+            setup_logging("DEBUG")
+
+        assert mock_configure.call_count == 2
+
+    @pytest.mark.usefixtures("unconfigured_logging")
+    def test_plain_command_keeps_stderr_quiet(self, runner, tmp_path):
+        """Test that informational logs stay hidden unless --log-level asks for them."""
+        result = runner.invoke(cli, ["alerts"], env={"WISERATE_DATA_DIR": str(tmp_path)})
+
+        assert result.exit_code == 0
+        assert "No active alerts" in result.stdout
+        assert result.stderr == ""
+
+    def test_interactive_help_and_quit(self, runner):
+        """Test the single-word interactive commands."""
+        result = runner.invoke(cli, ["interactive"], input="\nhelp\nQUIT\n")
+        assert result.exit_code == 0
+        assert "Available Commands" in result.output
+        assert "Goodbye!" in result.output
+
+    def test_interactive_refreshes_rates_only_when_asked(self, runner):
+        """Test that the background refresh is opt-in and stopped before the app."""
+        events = []
+
+        async def fake_refresh(app, interval):
+            events.append(("started", interval))
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await asyncio.sleep(0)
+                events.append("cancelled")
+
+        async def fake_stop(self):
+            events.append("stopped")
+
+        with (
+            patch("wiserate.cli._refresh_rates_periodically", fake_refresh),
+            patch("wiserate.app.WiseRateApp.stop", fake_stop),
+        ):
+            result = runner.invoke(cli, ["interactive"], input="quit\n")
+            assert result.exit_code == 0
+            assert events == ["stopped"]
+
+            events.clear()
+            result = runner.invoke(cli, ["interactive", "--refresh-interval", "60"], input="quit\n")
+            assert result.exit_code == 0
+            assert events == [("started", 60), "cancelled", "stopped"]
+
+    def test_batch_runs_commands_from_stdin(self, runner):
+        """Test that batch executes each stdin line on one app instance."""
+        result = runner.invoke(cli, ["batch"], input="# comment\nvalidate usd\n\nvalidate xyz\n")
+        assert result.exit_code == 0
+        assert "USD is a valid currency code" in result.output
+        assert "XYZ is not a valid currency code" in result.output
+
+    def test_alert_passes_exact_decimal_threshold(self, runner):
+        """Test that the threshold reaches the app as the Decimal that was typed."""
+        with patch("wiserate.app.WiseRateApp.set_alert", return_value=True) as mock_set:
+            result = runner.invoke(cli, ["alert", "usd", "eur", "1.10"])
+
+        assert result.exit_code == 0
+        mock_set.assert_called_once_with("USD", "EUR", Decimal("1.10"), True)
+        assert str(mock_set.call_args.args[2]) == "1.10"
+
+    def test_alert_rejects_invalid_threshold(self, runner):
+        """Test that a non-numeric threshold is a usage error."""
+        result = runner.invoke(cli, ["alert", "USD", "EUR", "abc"])
+        assert result.exit_code == 2
+        assert "'abc' is not a valid number" in result.output
+
     def test_currencies_command(self, runner):
         """Test currencies command."""
         result = runner.invoke(cli, ["currencies"])
         assert result.exit_code == 0
         assert "USD" in result.output
         assert "EUR" in result.output
+        assert "USD\tUS Dollar" in result.output.splitlines()
 
     def test_validate_currency_valid(self, runner):
         """Test currency validation with valid code."""
@@ -45,3 +257,64 @@ class TestCLI:
         result = runner.invoke(cli, ["validate-currency", "XXX"])
         assert result.exit_code == 0
         assert "not a valid currency code" in result.output
+
+    @pytest.mark.asyncio
+    async def test_interactive_currencies_page(self, capsys):
+        """Test paging through currencies in interactive mode."""
+        await execute_interactive_command(MagicMock(), MagicMock(), "currencies 1")
+
+        # Not a terminal, so rows are written as plain tab-separated lines
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 20
+        assert lines[0].startswith("AED\t")
+
+    @pytest.mark.asyncio
+    async def test_interactive_unknown_command(self, capsys):
+        """Test that unknown interactive commands are reported."""
+        await execute_interactive_command(MagicMock(), MagicMock(), "frobnicate")
+
+        assert "Unknown command: frobnicate" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_interactive_alert_invalid_threshold(self, capsys):
+        """Test that a non-numeric threshold is rejected before setting an alert."""
+        app = MagicMock()
+        await execute_interactive_command(app, MagicMock(), "alert USD EUR abc")
+
+        assert "Invalid threshold value: abc" in capsys.readouterr().out
+        app.set_alert.assert_not_called()
+
+    def test_config_table_cached_per_values(self, tmp_path):
+        """Test that the config table is rebuilt only when a shown value changes."""
+        settings = Settings(data_dir=tmp_path)
+        table = _config_table(settings)
+
+        assert _config_table(settings) is table
+        assert _config_table(Settings(data_dir=tmp_path)) is table
+
+        settings.cache_ttl = 120
+        updated = _config_table(settings)
+        assert updated is not table
+        assert "120s" in list(updated.columns[1].cells)
+
+    def test_currencies_table_cached_per_page(self):
+        """Test that currency tables are built once per page."""
+        assert _currencies_table() is _currencies_table()
+        assert _currencies_table(1) is _currencies_table(1)
+        assert _currencies_table(1).row_count == 20
+        assert _currencies_table().row_count > _currencies_table(1).row_count
+
+    @pytest.mark.asyncio
+    async def test_interactive_help(self, capsys):
+        """Test that help can be shown repeatedly from the cached table."""
+        for _ in range(2):
+            await execute_interactive_command(MagicMock(), MagicMock(), "help")
+
+        assert capsys.readouterr().out.count("Available Commands") == 2
+
+    def test_partition_flags(self):
+        """Test that flags are separated from positionals regardless of position."""
+        positional, flags = _partition_flags(["rate", "--update", "EUR", "USD", "-u"])
+
+        assert positional == ["rate", "EUR", "USD"]
+        assert flags == {"--update", "-u"}
@@ -1,10 +1,19 @@
 """Tests for configuration management."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from wiserate.config import Settings
+from wiserate.config import (
+    Settings,
+    _ensured_dirs,
+    _load_settings,
+    _parse_env,
+    get_settings,
+    reload_settings,
+)
 from wiserate.constants import (
     DEFAULT_CACHE_TTL,
     DEFAULT_LOG_LEVEL,
@@ -14,6 +23,7 @@ from wiserate.constants import (
     MIN_CACHE_TTL,
     MIN_REQUESTS_PER_MINUTE,
     SUPPORTED_LOG_LEVELS,
+    SUPPORTED_LOG_LEVELS_DISPLAY,
 )
 
 
@@ -64,9 +74,12 @@ class TestSettings:
         assert custom_settings.max_requests_per_minute == 45
 
     def test_data_directory_creation(self, tmp_path):
-        """Test that data directory is created automatically."""
+        """Test that data directory is created when a data file is first used."""
         custom_data_dir = tmp_path / "wiserate_data"
-        _ = Settings(data_dir=custom_data_dir)
+        settings = Settings(data_dir=custom_data_dir)
+        assert not custom_data_dir.exists()
+
+        _ = settings.alerts_file
 
         assert custom_data_dir.exists()
         assert custom_data_dir.is_dir()
@@ -74,10 +87,95 @@ class TestSettings:
     def test_file_paths(self, tmp_path):
         """Test file path properties."""
         custom_data_dir = tmp_path / "wiserate_data"
-        _ = Settings(data_dir=custom_data_dir)
+        settings = Settings(data_dir=custom_data_dir)
 
-        assert custom_data_dir.exists()
-        assert custom_data_dir.is_dir()
+        assert settings.currencies_file == custom_data_dir / "currencies.json"
+        assert settings.alerts_file == custom_data_dir / "alerts.json"
+        assert settings.log_file == custom_data_dir / "wiserate.log"
+
+    def test_file_paths_cached_until_data_dir_changes(self, tmp_path):
+        """Test that file paths are computed once and follow data_dir assignment."""
+        settings = Settings(data_dir=tmp_path / "first")
+        assert settings.alerts_file is settings.alerts_file
+
+        settings.data_dir = tmp_path / "second"
+
+        assert settings.alerts_file == tmp_path / "second" / "alerts.json"
+        assert (tmp_path / "second").is_dir()
+
+    def test_get_settings_cached_per_environment(self, monkeypatch, tmp_path):
+        """Test that get_settings() reuses settings until the environment changes."""
+        monkeypatch.setenv("WISERATE_DATA_DIR", str(tmp_path))
+        settings = get_settings()
+        assert get_settings() is settings
+
+        monkeypatch.setenv("WISERATE_CACHE_TTL", "7200")
+        reloaded = get_settings()
+        assert reloaded is not settings
+        assert reloaded.cache_ttl == 7200
+
+    def test_environment_overrides(self, monkeypatch, tmp_path):
+        """Test that env vars are applied, parsed once, and lose to keyword arguments."""
+        monkeypatch.setenv("WISERATE_DATA_DIR", str(tmp_path))
+        monkeypatch.setenv("WISERATE_CACHE_TTL", "7200")
+        monkeypatch.setenv("WISERATE_LOG_LEVEL", "debug")
+
+        settings = Settings()
+        assert settings.data_dir == tmp_path
+        assert settings.cache_ttl == 7200
+        assert settings.log_level == "DEBUG"
+
+        misses = _parse_env.cache_info().misses
+        assert Settings(cache_ttl=300).cache_ttl == 300
+        assert _parse_env.cache_info().misses == misses
+
+    def test_invalid_environment_integers_ignored(self, monkeypatch, tmp_path):
+        """Test that unparseable or empty env values fall back to defaults."""
+        monkeypatch.setenv("WISERATE_DATA_DIR", str(tmp_path))
+        monkeypatch.setenv("WISERATE_CACHE_TTL", "soon")
+        monkeypatch.setenv("WISERATE_MAX_REQUESTS_PER_MINUTE", "")
+
+        settings = Settings()
+        assert settings.cache_ttl == DEFAULT_CACHE_TTL
+        assert settings.max_requests_per_minute == DEFAULT_MAX_REQUESTS_PER_MINUTE
+
+    def test_reload_settings(self, monkeypatch, tmp_path):
+        """Test that reload_settings() replaces the cached instance."""
+        monkeypatch.setenv("WISERATE_DATA_DIR", str(tmp_path))
+        settings = get_settings()
+
+        reloaded = reload_settings()
+
+        assert reloaded is not settings
+        assert reloaded == settings
+        assert get_settings() is reloaded
+
+    def test_data_directory_created_once(self, tmp_path):
+        """Test that the data directory is only created on first use."""
+        custom_data_dir = tmp_path / "wiserate_data"
+        _ = Settings(data_dir=custom_data_dir).currencies_file
+        assert custom_data_dir in _ensured_dirs
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            _ = Settings(data_dir=custom_data_dir).alerts_file
+        mock_mkdir.assert_not_called()
+
+    def test_fast_default_matches_validated_defaults(self, monkeypatch):
+        """Test that the unvalidated defaults equal a validated Settings()."""
+        for name in [k for k in os.environ if k.startswith("WISERATE_")]:
+            monkeypatch.delenv(name)
+
+        assert Settings.fast_default() == Settings()
+
+    def test_get_settings_skips_validation_without_overrides(self, monkeypatch):
+        """Test that get_settings() uses the unvalidated defaults when nothing is set."""
+        for name in [k for k in os.environ if k.startswith("WISERATE_")]:
+            monkeypatch.delenv(name)
+        _load_settings.cache_clear()
+
+        with patch.object(Settings, "fast_default", wraps=Settings.fast_default) as mock_fast:
+            get_settings()
+        mock_fast.assert_called_once()
 
 
 class TestSettingsValidation:
@@ -162,10 +260,31 @@ class TestSettingsValidation:
         for level in invalid_levels:
             with pytest.raises(
                 ValueError,
-                match=f"Log level must be one of: {', '.join(SUPPORTED_LOG_LEVELS)}",
+                match=f"Log level must be one of: {', '.join(SUPPORTED_LOG_LEVELS_DISPLAY)}",
             ):
                 Settings(log_level=level)
 
+    def test_cache_stale_ttl_validation(self):
+        """Test the stale-while-revalidate window bounds."""
+        assert Settings(cache_stale_ttl=0).cache_stale_ttl == 0
+        assert Settings(cache_stale_ttl="120").cache_stale_ttl == 120
+
+        with pytest.raises(ValueError, match="Cache stale TTL must be between"):
+            Settings(cache_stale_ttl=-1)
+        with pytest.raises(ValueError, match="Cache stale TTL must be between"):
+            Settings(cache_stale_ttl=MAX_CACHE_TTL + 1)
+
+    def test_assignment_is_validated(self):
+        """Test that assigned values go through the same validation."""
+        settings = Settings()
+
+        settings.log_level = "debug"
+        assert settings.log_level == "DEBUG"
+
+        with pytest.raises(ValueError, match="Cache TTL must be between"):
+            settings.cache_ttl = MIN_CACHE_TTL - 1
+        assert settings.cache_ttl == DEFAULT_CACHE_TTL
+
     def test_log_level_case_insensitive(self):
         """Test that log levels are case-insensitive."""
         settings = Settings(log_level="debug")
@@ -177,6 +296,14 @@ class TestSettingsValidation:
         settings = Settings(log_level="ERROR")
         assert settings.log_level == "ERROR"
 
+    def test_log_level_uppercase_returned_as_is(self):
+        """Test that an already-uppercase level is returned without copying."""
+        level = "".join(["WARN", "ING"])
+        assert Settings.validate_log_level(level) is level
+
+        with pytest.raises(ValueError, match="Log level must be one of"):
+            Settings.validate_log_level(["DEBUG"])
+
 
 class TestSettingsOverrides:
     """Test configuration override handling."""
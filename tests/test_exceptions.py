@@ -7,6 +7,8 @@ from wiserate.exceptions import (
     APIError,
     CacheError,
     ConfigurationError,
+    NetworkError,
+    RateLimitError,
     ValidationError,
     WiseRateError,
 )
@@ -27,6 +29,12 @@ class TestWiseRateError:
         error = WiseRateError(message)
         assert str(error) == message
 
+    def test_wise_rate_error_details(self):
+        """Test that details are appended to the message."""
+        error = WiseRateError("Test error", details="more context")
+        assert str(error) == "Test error: more context"
+        assert error.details == "more context"
+
 
 class TestConfigurationError:
     """Test ConfigurationError exception."""
@@ -164,3 +172,20 @@ class TestExceptionHierarchy:
             assert str(e) == "Alert test"
         except Exception:
             pytest.fail("AlertError should be caught by AlertError")
+
+
+class TestExceptionSlots:
+    """Test that exception attributes live in slots."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            WiseRateError("error", details="details"),
+            APIError("error", status_code=500, response_text="body"),
+            RateLimitError("error", retry_after=30),
+            NetworkError("error"),
+        ],
+    )
+    def test_attributes_do_not_populate_instance_dict(self, error):
+        """Test that setting the declared attributes leaves __dict__ empty."""
+        assert error.__dict__ == {}
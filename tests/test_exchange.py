@@ -1,7 +1,8 @@
 """Tests for the exchange rate service."""
 
 import asyncio
-from datetime import UTC, datetime
+import json
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,8 +10,8 @@ import httpx
 import pytest
 
 from wiserate.config import Settings
-from wiserate.exceptions import APIError
-from wiserate.exchange import ExchangeRateService, RateLimiter
+from wiserate.exceptions import APIError, CacheError
+from wiserate.exchange import ExchangeRateService, RateLimiter, _clients
 from wiserate.models import CurrencyPair, ExchangeRate
 
 
@@ -59,6 +60,53 @@ class TestRateLimiter:
         # Token count should be decremented
         assert limiter.tokens < 0.5
 
+    def test_rate_limiter_partial_refill(self):
+        """Test that refills shorter than one token interval are kept."""
+        limiter = RateLimiter(requests_per_minute=60)
+        limiter.tokens = 0
+        limiter.last_refill -= 0.5
+
+        limiter._refill()
+
+        assert 0.5 <= limiter.tokens < 0.6
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_sleeps_without_lock(self):
+        """Test that a waiting caller doesn't hold the lock while it sleeps."""
+        limiter = RateLimiter(requests_per_minute=60)
+        limiter.tokens = 0
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        try:
+            assert not waiter.done()
+            assert not limiter._lock.locked()
+        finally:
+            waiter.cancel()
+
+    def test_rate_limiter_adapts_to_feedback(self):
+        """Test that failures cut the rate and successes restore it."""
+        limiter = RateLimiter(requests_per_minute=60)
+        assert limiter.rate == 1.0
+
+        limiter.on_failure()
+        assert limiter.rate == 0.5
+        assert limiter.congestion_rate == 1.0
+        assert limiter.tokens == 0
+
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.rate == 1.0
+
+    def test_rate_limiter_rate_floor(self):
+        """Test that repeated failures never drop the rate below sigma."""
+        limiter = RateLimiter(requests_per_minute=60, sigma=0.25)
+
+        for _ in range(10):
+            limiter.on_failure()
+
+        assert limiter.rate == 0.25
+
 
 class TestExchangeRateService:
     """Test exchange rate service."""
@@ -73,6 +121,62 @@ class TestExchangeRateService:
         """Create exchange rate service for testing."""
         return ExchangeRateService(settings)
 
+    @pytest.mark.asyncio
+    async def test_client_shared_per_event_loop(self, settings):
+        """Test that services on one loop share a client until the last one closes."""
+        service = ExchangeRateService(settings)
+        other = ExchangeRateService(settings)
+        assert service._client is None
+
+        client = service._get_client()
+        assert other._get_client() is client
+
+        await service.close()
+        assert not client.is_closed
+        assert other._get_client() is client
+
+        await other.close()
+        assert client.is_closed
+        assert asyncio.get_running_loop() not in _clients
+
+        replacement = service._get_client()
+        assert replacement is not client
+        await service.close()
+        assert replacement.is_closed
+
+    def test_clients_of_closed_loops_dropped(self, settings):
+        """Test that clients left behind by closed loops don't accumulate."""
+
+        async def get_client():
+            return ExchangeRateService(settings)._get_client()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(get_client())
+        loop.close()
+        assert loop in _clients
+
+        second = asyncio.new_event_loop()
+        try:
+            client = second.run_until_complete(get_client())
+            assert loop not in _clients
+            second.run_until_complete(client.aclose())
+        finally:
+            _clients.pop(second, None)
+            second.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("h2_installed", [True, False])
+    async def test_client_uses_http2_when_available(self, service, h2_installed):
+        """Test that HTTP/2 is only requested when h2 is installed."""
+        with (
+            patch("wiserate.exchange._HTTP2", h2_installed),
+            patch("httpx.AsyncClient") as mock_client,
+            patch.dict(_clients, clear=True),
+        ):
+            service._get_client()
+
+        assert mock_client.call_args.kwargs["http2"] is h2_installed
+
     @pytest.mark.asyncio
     async def test_get_exchange_rate_success(self, service):
         """Test successful exchange rate fetch."""
@@ -139,6 +243,45 @@ class TestExchangeRateService:
             assert result.target == "EUR"
             assert result.rate == Decimal("0.85")
 
+    @pytest.mark.asyncio
+    async def test_fetch_exchange_rate_keeps_api_digits(self, service):
+        """Test that rates are decoded as Decimal without a float round trip."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        request = httpx.Request("GET", "https://example.com/latest/USD")
+        response = httpx.Response(
+            200, request=request, content=b'{"rates": {"EUR": 0.12345678901234567890}}'
+        )
+
+        with patch.object(service, "_client") as mock_client:
+            mock_client.get = AsyncMock(return_value=response)
+
+            result = await service._fetch_exchange_rate(pair)
+
+        assert result.rate == Decimal("0.12345678901234567890")
+
+    @pytest.mark.asyncio
+    async def test_same_source_fetches_share_one_request(self, service):
+        """Test that concurrent fetches for one source make a single API call."""
+        request = httpx.Request("GET", "https://example.com/latest/USD")
+        response = httpx.Response(
+            200, request=request, content=b'{"rates": {"EUR": 0.85, "GBP": 0.73}}'
+        )
+
+        with (
+            patch.object(service, "_client") as mock_client,
+            patch.object(service, "_save_to_cache"),
+        ):
+            mock_client.get = AsyncMock(return_value=response)
+
+            eur, gbp = await asyncio.gather(
+                service.get_exchange_rate(CurrencyPair(source="USD", target="EUR")),
+                service.get_exchange_rate(CurrencyPair(source="USD", target="GBP")),
+            )
+
+        assert (eur.rate, gbp.rate) == (Decimal("0.85"), Decimal("0.73"))
+        mock_client.get.assert_awaited_once()
+        assert service._pending_sources == {}
+
     @pytest.mark.asyncio
     async def test_fetch_exchange_rate_rate_not_found(self, service):
         """Test API response without requested currency."""
@@ -171,6 +314,124 @@ class TestExchangeRateService:
             with pytest.raises(APIError, match="API error: 404"):
                 await service._fetch_exchange_rate(pair)
 
+    @pytest.mark.asyncio
+    async def test_fetch_rate_limited_response_slows_limiter(self, service):
+        """Test that a 429 response feeds back into the rate limiter."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        request = httpx.Request("GET", "https://example.com/latest/USD")
+        response = httpx.Response(429, request=request, text="Too Many Requests")
+        rate = service._rate_limiter.rate
+
+        with (
+            patch.object(service, "_client") as mock_client,
+            patch("wiserate.exchange.retry_with_backoff", new=lambda func: func()),
+        ):
+            mock_client.get = AsyncMock(return_value=response)
+
+            with pytest.raises(APIError, match="API error: 429"):
+                await service._fetch_exchange_rate(pair)
+
+        assert service._rate_limiter.rate == rate / 2
+        assert service._rate_limiter.tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_writes_are_batched(self, service):
+        """Test that queued rates are written together after the flush delay."""
+        rates = [
+            ExchangeRate(source="USD", target=target, rate=Decimal("1.5"))
+            for target in ("EUR", "GBP", "JPY")
+        ]
+
+        with (
+            patch("wiserate.exchange.CACHE_FLUSH_DELAY", 0),
+            patch("wiserate.exchange.save_json_file_async", new_callable=AsyncMock) as mock_save,
+        ):
+            for rate in rates:
+                service._save_to_cache(rate)
+            mock_save.assert_not_called()
+
+            await service._flush_task
+
+        mock_save.assert_awaited_once()
+        assert set(mock_save.call_args.args[1]) == {"USD_EUR", "USD_GBP", "USD_JPY"}
+        assert service._dirty_rates == {}
+        assert service._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_queued_rates(self, service):
+        """Test that closing the service writes rates still waiting for a flush."""
+        service._save_to_cache(ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85")))
+
+        await service.close()
+
+        cache_data = json.loads(service.settings.currencies_file.read_text())
+        assert cache_data["USD_EUR"]["rate"] == "0.85"
+        assert service._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_rates_queued(self, service):
+        """Test that rates stay queued when the cache write fails."""
+        service._save_to_cache(ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85")))
+
+        with (
+            patch(
+                "wiserate.exchange.save_json_file_async",
+                new_callable=AsyncMock,
+                side_effect=OSError("disk full"),
+            ),
+            pytest.raises(CacheError, match="disk full"),
+        ):
+            await service.flush()
+
+        assert set(service._dirty_rates) == {"USD_EUR"}
+
+    @pytest.mark.asyncio
+    async def test_load_from_cache_skips_malformed_entries(self, service):
+        """Test that cached rates load without revalidation and bad entries are skipped."""
+        stamp = "2026-01-02T03:04:05+00:00"
+        cache_data = {
+            f"USD_{target}": {"source": "USD", "target": target, "rate": rate, "timestamp": stamp}
+            for target, rate in [("EUR", "0.85"), ("GBP", "0.73"), ("JPY", "abc"), ("CAD", "-1")]
+        }
+        cache_data["USD_AUD"] = {"source": "USD", "target": "AUD", "rate": "1.5"}
+        cache_data["USD_CHF"] = ["not", "an", "entry"]
+        service.settings.currencies_file.write_text(json.dumps(cache_data))
+
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            rates = await service._load_from_cache()
+
+        # Parsed off the event loop
+        mock_to_thread.assert_called_once_with(service._parse_cache_entries, cache_data)
+        assert [rate.cache_key for rate in rates] == ["USD_EUR", "USD_GBP"]
+        assert rates[0].rate == Decimal("0.85")
+        assert rates[0].timestamp == datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        assert rates[0].timestamp is rates[1].timestamp
+
+    @pytest.mark.asyncio
+    async def test_get_exchange_rates_groups_by_source(self, service):
+        """Test that bulk fetches make one request per source currency."""
+        pairs = [
+            CurrencyPair(source="USD", target="EUR"),
+            CurrencyPair(source="USD", target="GBP"),
+            CurrencyPair(source="USD", target="JPY"),
+        ]
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"rates": {"EUR": 0.85, "GBP": 0.73}}
+        mock_response.raise_for_status = MagicMock()
+
+        with patch.object(service, "_client") as mock_client:
+            mock_client.get = AsyncMock(return_value=mock_response)
+
+            rates = await service.get_exchange_rates(pairs)
+
+            mock_client.get.assert_called_once()
+            assert {rate.target: rate.rate for rate in rates} == {
+                "EUR": Decimal("0.85"),
+                "GBP": Decimal("0.73"),
+            }
+            assert service._is_cache_valid("USD_GBP")
+
     @pytest.mark.asyncio
     async def test_is_cache_valid(self, service):
         """Test cache validity checking."""
@@ -184,11 +445,122 @@ class TestExchangeRateService:
             source="USD", target="EUR", rate=Decimal("0.85"), timestamp=datetime.now(UTC)
         )
         service._cache[cache_key] = rate
-        service._last_update = datetime.now(UTC)
 
         # Should be valid
         assert service._is_cache_valid(cache_key)
 
+    def test_cache_validity_is_per_entry(self, service):
+        """Test that each cached rate expires on its own timestamp."""
+        expired_at = datetime.now(UTC) - timedelta(seconds=service.settings.cache_ttl + 1)
+        service._cache["USD_EUR"] = ExchangeRate(
+            source="USD", target="EUR", rate=Decimal("0.85"), timestamp=expired_at
+        )
+        service._cache["USD_GBP"] = ExchangeRate(
+            source="USD", target="GBP", rate=Decimal("0.73"), timestamp=datetime.now(UTC)
+        )
+
+        assert not service._is_cache_valid("USD_EUR")
+        assert service._is_cache_valid("USD_GBP")
+
+    def test_memory_cache_evicts_least_recently_used(self, service):
+        """Test that the memory cache is capped and keeps recently read rates."""
+        rates = [
+            ExchangeRate(source="USD", target=target, rate=Decimal("1.5"))
+            for target in ("EUR", "GBP", "JPY")
+        ]
+
+        with patch("wiserate.exchange.CACHE_MAX_ENTRIES", 2):
+            service._remember(rates[0])
+            service._remember(rates[1])
+            assert service._is_cache_valid("USD_EUR")
+            service._remember(rates[2])
+
+        assert list(service._cache) == ["USD_EUR", "USD_JPY"]
+
+    @pytest.mark.asyncio
+    async def test_stale_rate_served_while_refreshing(self, service):
+        """Test that a recently expired rate is returned and refreshed in the background."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        expired_at = datetime.now(UTC) - timedelta(seconds=service.settings.cache_ttl + 1)
+        stale = ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85"), timestamp=expired_at)
+        fresh = ExchangeRate(
+            source="USD", target="EUR", rate=Decimal("0.90"), timestamp=datetime.now(UTC)
+        )
+        service._cache["USD_EUR"] = stale
+
+        with (
+            patch.object(service, "_fetch_exchange_rate", return_value=fresh) as mock_fetch,
+            patch.object(service, "_save_to_cache"),
+        ):
+            assert await service.get_exchange_rate(pair) is stale
+            assert "USD_EUR" in service._pending_requests
+
+            await service._pending_requests["USD_EUR"]
+
+        mock_fetch.assert_called_once_with(pair)
+        assert service._cache["USD_EUR"] is fresh
+
+    @pytest.mark.asyncio
+    async def test_stale_refresh_failure_logged_once(self, service):
+        """Test that concurrent stale hits share one refresh and log its failure once."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        expired_at = datetime.now(UTC) - timedelta(seconds=service.settings.cache_ttl + 1)
+        stale = ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85"), timestamp=expired_at)
+        service._cache["USD_EUR"] = stale
+
+        with (
+            patch.object(service, "_fetch_exchange_rate", side_effect=APIError("down")),
+            patch("wiserate.exchange.logger") as mock_logger,
+        ):
+            assert await service.get_exchange_rate(pair) is stale
+            assert await service.get_exchange_rate(pair) is stale
+            [refresh] = service._refresh_tasks
+            await asyncio.gather(refresh, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        mock_logger.warning.assert_called_once_with("Background rate refresh failed", error="down")
+        assert not service._refresh_tasks
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_stale_refreshes(self, service):
+        """Test that close() cancels background refreshes before closing the client."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        expired_at = datetime.now(UTC) - timedelta(seconds=service.settings.cache_ttl + 1)
+        service._cache["USD_EUR"] = ExchangeRate(
+            source="USD", target="EUR", rate=Decimal("0.85"), timestamp=expired_at
+        )
+
+        async def hang(currency_pair):
+            await asyncio.Event().wait()
+
+        with patch.object(service, "_fetch_exchange_rate", side_effect=hang):
+            await service.get_exchange_rate(pair)
+            [refresh] = service._refresh_tasks
+            await service.close()
+
+        assert refresh.cancelled()
+        assert not service._refresh_tasks
+
+    @pytest.mark.asyncio
+    async def test_rate_past_stale_window_is_fetched(self, service):
+        """Test that a rate past the stale window is fetched before returning."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        settings = service.settings
+        expired_at = datetime.now(UTC) - timedelta(
+            seconds=settings.cache_ttl + settings.cache_stale_ttl + 1
+        )
+        stale = ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85"), timestamp=expired_at)
+        fresh = ExchangeRate(
+            source="USD", target="EUR", rate=Decimal("0.90"), timestamp=datetime.now(UTC)
+        )
+        service._cache["USD_EUR"] = stale
+
+        with (
+            patch.object(service, "_fetch_exchange_rate", return_value=fresh),
+            patch.object(service, "_save_to_cache"),
+        ):
+            assert await service.get_exchange_rate(pair) is fresh
+
     @pytest.mark.asyncio
     async def test_get_exchange_rate_with_update_cache(self, service):
         """Test getting exchange rate with cache update."""
@@ -199,7 +571,6 @@ class TestExchangeRateService:
             source="USD", target="EUR", rate=Decimal("0.85"), timestamp=datetime.now(UTC)
         )
         service._cache["USD_EUR"] = rate
-        service._last_update = datetime.now(UTC)
 
         # Mock _fetch_exchange_rate to return a different rate
         with patch.object(service, "_fetch_exchange_rate", new_callable=AsyncMock) as mock_fetch:
@@ -229,3 +600,76 @@ class TestExchangeRateService:
             # Should fetch rates for multiple currency pairs
             rates = await service.get_all_rates()
             assert len(rates) >= 0  # Implementation dependent
+
+    @pytest.mark.asyncio
+    async def test_get_all_rates_coalesces_concurrent_calls(self, service):
+        """Test that concurrent get_all_rates() calls share one fetch."""
+        release = asyncio.Event()
+        rate = ExchangeRate(
+            source="USD", target="EUR", rate=Decimal("0.85"), timestamp=datetime.now(UTC)
+        )
+
+        async def slow_fetch():
+            await release.wait()
+            return [rate]
+
+        with (
+            patch.object(service, "_fetch_all_rates", side_effect=slow_fetch) as mock_fetch,
+            patch.object(service, "_save_all_to_cache", new_callable=AsyncMock),
+        ):
+            callers = [asyncio.create_task(service.get_all_rates()) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+
+        assert mock_fetch.call_count == 1
+        assert results == [[rate]] * 3
+        assert service._pending_all is None
+
+    @pytest.mark.asyncio
+    async def test_forced_refreshes_are_coalesced(self, service):
+        """Test that concurrent update_cache=True calls share one fetch."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        rate = ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85"))
+
+        with (
+            patch.object(service, "_fetch_exchange_rate", return_value=rate) as mock_fetch,
+            patch.object(service, "_save_to_cache"),
+        ):
+            results = await asyncio.gather(
+                *(service.get_exchange_rate(pair, update_cache=True) for _ in range(5))
+            )
+
+        assert results == [rate] * 5
+        mock_fetch.assert_called_once_with(pair)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_shared_fetch(self, service):
+        """Test that cancelling one caller doesn't cancel a deduplicated fetch."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        release = asyncio.Event()
+        rate = ExchangeRate(
+            source="USD", target="EUR", rate=Decimal("0.85"), timestamp=datetime.now(UTC)
+        )
+
+        async def slow_fetch(_pair):
+            await release.wait()
+            return rate
+
+        with (
+            patch.object(service, "_fetch_exchange_rate", side_effect=slow_fetch) as mock_fetch,
+            patch.object(service, "_save_to_cache"),
+        ):
+            first = asyncio.create_task(service.get_exchange_rate(pair))
+            second = asyncio.create_task(service.get_exchange_rate(pair))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+
+            assert await second is rate
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+        assert mock_fetch.call_count == 1
+        assert service._cache["USD_EUR"] is rate
+        assert service._pending_requests == {}
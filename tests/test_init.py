@@ -0,0 +1,36 @@
+"""Tests for the package's public exports."""
+
+import tomllib
+from pathlib import Path
+
+import pytest
+
+import wiserate
+from wiserate import exceptions
+
+
+class TestPackageExports:
+    """Test lazily resolved package-level names."""
+
+    def test_network_and_rate_limit_errors_resolve(self):
+        """Test that the exception re-exports resolve to the real classes."""
+        assert wiserate.NetworkError is exceptions.NetworkError
+        assert wiserate.RateLimitError is exceptions.RateLimitError
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ can be imported."""
+        for name in wiserate.__all__:
+            assert getattr(wiserate, name) is not None
+
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            _ = wiserate.Missing
+
+    def test_version_matches_project_metadata(self):
+        """Test that __version__ agrees with pyproject.toml."""
+        pyproject = Path(__file__).parent.parent / "pyproject.toml"
+        with pyproject.open("rb") as f:
+            project = tomllib.load(f)["project"]
+
+        assert wiserate.__version__ == project["version"]
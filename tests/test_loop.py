@@ -0,0 +1,96 @@
+"""Tests for the persistent event loop thread."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from wiserate._loop import _new_event_loop, cancel, run_sync, spawn
+
+
+class TestRunSync:
+    """Test running coroutines on the shared loop thread."""
+
+    def test_returns_result(self):
+        """Test that the coroutine's result is returned."""
+
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert run_sync(add(1, 2)) == 3
+
+    def test_reuses_loop(self):
+        """Test that consecutive calls run on the same event loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_sync(current_loop()) is run_sync(current_loop())
+
+    def test_propagates_exceptions(self):
+        """Test that exceptions raised by the coroutine reach the caller."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(fail())
+
+    def test_spawn_runs_in_background_until_cancelled(self):
+        """Test that spawned coroutines run alongside run_sync calls until cancelled."""
+        started = asyncio.Event()
+
+        async def forever():
+            started.set()
+            await asyncio.Event().wait()
+
+        task = spawn(forever())
+        run_sync(started.wait())
+        assert not task.done()
+
+        assert run_sync(asyncio.sleep(0, "still running")) == "still running"
+        assert not task.done()
+
+        cancel(task)
+        assert task.cancelled()
+
+    def test_cancel_waits_for_cleanup(self):
+        """Test that cancel() returns only after the task's cleanup has run."""
+        events = []
+
+        async def forever():
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await asyncio.sleep(0)
+                events.append("cleaned up")
+
+        task = spawn(forever())
+        cancel(task)
+
+        assert events == ["cleaned up"]
+        assert task.cancelled()
+
+
+class TestNewEventLoop:
+    """Test event loop creation."""
+
+    def test_uses_uvloop_when_installed(self):
+        """Test that uvloop's loop is used when the package is importable."""
+        uvloop_loop = MagicMock()
+        fake_uvloop = SimpleNamespace(new_event_loop=lambda: uvloop_loop)
+
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            assert _new_event_loop() is uvloop_loop
+
+    def test_falls_back_to_asyncio(self):
+        """Test that the default asyncio loop is used without uvloop."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            loop = _new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+        finally:
+            loop.close()
@@ -43,6 +43,25 @@ class TestCurrencyPair:
         with pytest.raises(ValueError, match="Source and target currencies must be different"):
             CurrencyPair(source="EUR", target="EUR")
 
+    def test_currency_pair_is_immutable(self):
+        """Test that currency pairs are frozen and hashable."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        with pytest.raises(ValueError, match="frozen"):
+            pair.source = "GBP"
+        assert hash(pair) == hash(CurrencyPair(source="USD", target="EUR"))
+
+    def test_cache_key(self):
+        """Test that the cache key is built once and shared by equal pairs."""
+        pair = CurrencyPair(source="USD", target="EUR")
+        other = CurrencyPair(source="USD", target="EUR")
+
+        assert pair.cache_key == "USD_EUR"
+        assert pair.cache_key is pair.cache_key
+        assert other.cache_key is pair.cache_key
+        # The cached value isn't a field and doesn't affect equality
+        assert pair == other
+        assert pair.model_dump() == {"source": "USD", "target": "EUR"}
+
 
 class TestExchangeRate:
     """Test ExchangeRate model."""
@@ -75,6 +94,12 @@ class TestExchangeRate:
         with pytest.raises(Exception):  # Pydantic validation error
             ExchangeRate(source="EUR", target="USD", rate=Decimal("-1"))
 
+    def test_cache_key_matches_pair(self):
+        """Test that a rate's cache key is the key of its currency pair."""
+        rate = ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85"))
+
+        assert rate.cache_key is CurrencyPair(source="USD", target="EUR").cache_key
+
     def test_format_rate(self):
         """Test exchange rate formatting."""
         rate = ExchangeRate(source="USD", target="EUR", rate=Decimal("0.85"))
@@ -0,0 +1,43 @@
+"""Tests for the shared application context."""
+
+from unittest.mock import patch
+
+import pytest
+
+from wiserate._runtime import app_context, current_app
+from wiserate.app import WiseRateApp
+from wiserate.config import Settings
+
+
+class TestAppContext:
+    """Test app_context lifecycle and reuse."""
+
+    @pytest.fixture
+    def settings(self, tmp_path):
+        """Create settings for testing."""
+        return Settings(data_dir=tmp_path / "test_data")
+
+    @pytest.mark.asyncio
+    async def test_nested_contexts_share_app(self, settings):
+        """Test that nested contexts reuse the outer app and only it stops it."""
+        with patch.object(WiseRateApp, "stop") as mock_stop:
+            async with app_context(settings) as outer:
+                assert current_app() is outer
+
+                async with app_context(settings) as inner:
+                    assert inner is outer
+
+                mock_stop.assert_not_called()
+
+            mock_stop.assert_awaited_once()
+
+        assert current_app() is None
+
+    @pytest.mark.asyncio
+    async def test_app_cleared_on_error(self, settings):
+        """Test that the context var is reset when the body raises."""
+        with pytest.raises(RuntimeError):
+            async with app_context(settings):
+                raise RuntimeError("boom")
+
+        assert current_app() is None
@@ -1,6 +1,8 @@
 """Tests for utility functions."""
 
 import json
+import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -8,8 +10,12 @@ from wiserate.utils import (
     ensure_directory,
     format_currency_amount,
     get_currency_name,
+    json_dumps,
+    json_loads,
     load_json_file,
+    load_json_file_async,
     save_json_file,
+    save_json_file_async,
     validate_currency_code,
 )
 
@@ -146,6 +152,26 @@ class TestFileOperations:
         assert test_file.parent.exists()
         assert test_file.parent.parent.exists()
 
+    @pytest.mark.asyncio
+    async def test_save_json_file_uses_unique_temp_files(self, tmp_path):
+        """Test that sync and async saves write through uniquely named temp files."""
+        test_file = tmp_path / "alerts.json"
+        # A leftover from a fixed temp path must neither block nor be reused
+        stale_temp = tmp_path / "alerts.json.tmp"
+        stale_temp.write_text("partial")
+
+        with patch("wiserate.utils.tempfile.mkstemp", wraps=tempfile.mkstemp) as mock_mkstemp:
+            save_json_file(test_file, {"sync": True})
+            await save_json_file_async(test_file, {"async": True})
+
+        assert mock_mkstemp.call_count == 2
+        assert load_json_file(test_file) == {"async": True}
+        assert stale_temp.read_text() == "partial"
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "alerts.json",
+            "alerts.json.tmp",
+        ]
+
     def test_load_json_file_not_dict(self, tmp_path):
         """Test loading JSON file that's not a dict."""
         test_file = tmp_path / "not_dict.json"
@@ -180,6 +206,33 @@ class TestFileOperations:
         loaded_data = load_json_file(test_file)
         assert loaded_data == test_data
 
+    @pytest.mark.asyncio
+    async def test_async_json_file_round_trip(self, tmp_path):
+        """Test the async helpers write indented UTF-8 and read it back."""
+        test_file = tmp_path / "rates.json"
+        test_data = {"PLN": {"name": "Polish Złoty", "rate": "4.01"}, 1: "one"}
+
+        await save_json_file_async(test_file, test_data)
+
+        content = test_file.read_bytes()
+        assert "Złoty".encode() in content
+        assert b'\n  "PLN"' in content
+        assert await load_json_file_async(test_file) == {
+            "PLN": {"name": "Polish Złoty", "rate": "4.01"},
+            "1": "one",
+        }
+
+    def test_json_dumps_loads_round_trip(self):
+        """Test JSON helpers round-trip data and keep non-ASCII text."""
+        data = {"name": "Polish Złoty", "nested": {"count": 2}}
+
+        text = json_dumps(data, indent=True)
+
+        assert "Złoty" in text
+        assert "\n  " in text
+        assert json_loads(text) == data
+        assert json_loads(text.encode()) == data
+
 
 class TestRetryLogic:
     """Test retry with backoff functionality."""